@@ -0,0 +1,51 @@
+""" Times reading every cell of an Array2D three ways (arr[r][c], arr[r, c] and arr.get(r, c)) and prints the
+    average cost of one access, then times one Grid.count_neighbors pass, which makes up to eight lookups per cell.
+
+    Run from the repository root:
+        python -m benchmarks.array2d_access [side length, default 300]
+"""
+
+from __future__ import annotations
+import random
+import sys
+import time
+
+from datastructures.array2d import Array2D
+from projects.project2.grid import Grid
+
+
+def time_reads(array: Array2D[int], how: str) -> float:
+    """Reads every cell of array once using the given access style and returns the average seconds per read."""
+    rows, cols = len(array), array.get_num_cols()
+    start = time.perf_counter()
+    if how == 'arr[r][c]':
+        for r in range(rows):
+            for c in range(cols):
+                array[r][c]
+    elif how == 'arr[r, c]':
+        for r in range(rows):
+            for c in range(cols):
+                array[r, c]
+    else:
+        for r in range(rows):
+            for c in range(cols):
+                array.get(r, c)
+    return (time.perf_counter() - start) / (rows * cols)
+
+
+def time_count_neighbors(side: int) -> float:
+    """Builds a side x side Grid and returns the seconds per cell of one count_neighbors pass."""
+    random.seed(21)
+    grid = Grid(side, side)
+    start = time.perf_counter()
+    grid.count_neighbors()
+    return (time.perf_counter() - start) / (side * side)
+
+
+if __name__ == '__main__':
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    array = Array2D.empty(rows=side, cols=side, data_type=int)
+    print(f'{"access":>22} | {"ns per cell":>12}')
+    for how in ('arr[r][c]', 'arr[r, c]', 'arr.get(r, c)'):
+        print(f'{how:>22} | {time_reads(array, how) * 1e9:>12.1f}')
+    print(f'{"Grid.count_neighbors":>22} | {time_count_neighbors(side) * 1e9:>12.1f}')
@@ -0,0 +1,29 @@
+""" Times Array.append while the array grows from 10^3 to 10^7 elements and prints the average cost of one append.
+    With geometric growth the cost per append should stay flat as the array gets bigger.
+
+    Run from the repository root:
+        python -m benchmarks.array_append [largest power of ten, default 7]
+"""
+
+from __future__ import annotations
+import sys
+import time
+
+from datastructures.array import Array
+
+
+def time_appends(count: int) -> float:
+    """Appends count ints to an empty Array and returns the average seconds spent per append."""
+    array = Array[int]([], data_type=int)
+    start = time.perf_counter()
+    for i in range(count):
+        array.append(i)
+    return (time.perf_counter() - start) / count
+
+
+if __name__ == '__main__':
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    print(f'{"elements":>12} | {"ns per append":>14}')
+    for power in range(3, largest + 1):
+        count = 10 ** power
+        print(f'{count:>12} | {time_appends(count) * 1e9:>14.1f}')
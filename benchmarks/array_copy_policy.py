@@ -0,0 +1,44 @@
+""" Compares the copy policies of Array and ArrayStack on a Car-heavy workload: building an Array of Cars,
+    appending Cars one at a time and pushing Cars onto an ArrayStack.
+
+    Run from the repository root:
+        python -m benchmarks.array_copy_policy [number of cars, default 100000]
+"""
+
+from __future__ import annotations
+import sys
+import time
+from typing import Callable
+
+from datastructures.array import Array, CopyPolicy
+from datastructures.arraystack import ArrayStack
+from tests.car import Car, Color, Make, Model
+
+
+def seconds(work: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    work()
+    return time.perf_counter() - start
+
+
+def append_all(cars: list[Car], policy: CopyPolicy) -> None:
+    array = Array[Car]([], data_type=Car, copy_policy=policy)
+    for car in cars:
+        array.append(car)
+
+
+def push_all(cars: list[Car], policy: CopyPolicy) -> None:
+    stack = ArrayStack(max_size=len(cars), data_type=Car, copy_policy=policy)
+    for car in cars:
+        stack.push(car)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cars = [Car(str(i), Color.RED, Make.TOYOTA, Model.CAMRY) for i in range(count)]
+    print(f'{"policy":>10} | {"construct s":>11} | {"append s":>9} | {"push s":>7}')
+    for policy in CopyPolicy:
+        construct = seconds(lambda: Array[Car](cars, data_type=Car, copy_policy=policy))
+        append = seconds(lambda: append_all(cars, policy))
+        push = seconds(lambda: push_all(cars, policy))
+        print(f'{policy.name:>10} | {construct:>11.3f} | {append:>9.3f} | {push:>7.3f}')
@@ -0,0 +1,29 @@
+""" Reports how many bytes each element of an Array costs in typed mode (packed native dtype) compared with
+    object mode (a pointer per slot plus a boxed Python object per item).
+
+    Run from the repository root:
+        python -m benchmarks.array_memory [element count, default 1000000]
+"""
+
+from __future__ import annotations
+import sys
+
+from datastructures.array import Array
+
+
+def bytes_per_element(array: Array) -> float:
+    return array.memory_usage() / len(array)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    samples = {
+        int: [i for i in range(count)],
+        float: [i * 0.5 for i in range(count)],
+        bool: [i % 2 == 0 for i in range(count)],
+    }
+    print(f'{"data type":>10} | {"typed B/elem":>12} | {"object B/elem":>13}')
+    for data_type, values in samples.items():
+        typed = Array(values, data_type=data_type)
+        boxed = Array(values, data_type=object)
+        print(f'{data_type.__name__:>10} | {bytes_per_element(typed):>12.1f} | {bytes_per_element(boxed):>13.1f}')
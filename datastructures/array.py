@@ -6,20 +6,143 @@
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from enum import Enum, auto
+from functools import reduce
+from itertools import chain, islice
+import math
 import os
-from typing import Any, Iterator, overload
+import pickle
+import struct
+import sys
+from typing import Any, Callable, Iterator, overload
 import numpy as np
 from numpy.typing import NDArray
-from copy import deepcopy
+from copy import copy, deepcopy
 
 
 from datastructures.iarray import IArray, T
+from datastructures.parallel import map_chunk, reduce_chunk, run_chunks
+
+
+## Python types that are stored packed in a native numpy dtype instead of as Python objects.
+## Every other data type (str included, which numpy would otherwise truncate to fixed-width) uses dtype=object.
+NATIVE_DTYPES: dict[type, type] = {bool: np.bool_, int: np.int64, float: np.float64, complex: np.complex128}
+
+## numpy dtype kinds whose items pass isinstance(item, data_type) once they are Python values, so the bulk checks
+## accept exactly the items append() and __setitem__ accept (an int array takes bools, a float array does not take ints).
+NATIVE_KINDS: dict[type, str] = {bool: 'b', int: 'biu', float: 'f', complex: 'c'}
+
+## How many items extend() pulls from an iterator at a time before validating and copying them as one block.
+EXTEND_CHUNK_SIZE = 1 << 16
+
+## How many items iteration converts to native Python values at a time (bounds the temporary list tolist() builds).
+ITER_CHUNK_SIZE = 1 << 12
+
+## File format used by save() and load(): a 32 byte header (magic, version, kind, numpy dtype string, item count)
+## followed by the raw items of a typed array, or, for an object array, length-prefixed pickle records
+## (the first record is the data type itself). A file-backed typed Array (see from_file) uses the same layout.
+SAVE_MAGIC = b'DSARRAY\x00'
+SAVE_VERSION = 1
+SAVE_HEADER = struct.Struct('<8sBB8sQ6x')
+SAVE_RECORD = struct.Struct('<Q')
+
+## Where the item count sits inside SAVE_HEADER. A file-backed Array (see from_file) keeps these 8 bytes mapped and
+## updates them after every change, so a process that never calls close() still leaves the right count behind.
+SAVE_COUNT_OFFSET = struct.calcsize('<8sBB8s')
+
+
+def check_native_block(values: Sequence[Any] | NDArray, data_type: type) -> NDArray:
+    """Checks in bulk that every item of values is an instance of data_type (a key of NATIVE_DTYPES) and returns values
+        as a numpy array that can be assigned to a buffer of the native dtype without losing information.
+        A numpy array is checked by its dtype alone. Unsigned values are accepted for int as long as they fit in an int64.
+
+    Raises:
+        TypeError: if an item is not an instance of data_type or does not fit in the native dtype.
+    """
+    if not isinstance(values, np.ndarray):
+        items, values = values, np.asarray(values)
+        if data_type in (float, complex):   # numpy turns a list that mixes ints in with floats into floats, so look at the item types
+            if not all(issubclass(kind, data_type) for kind in set(map(type, items))):
+                raise TypeError(f"An item is not an instance of {data_type.__name__}.")
+    if values.size == 0:
+        return values
+    dtype = np.dtype(NATIVE_DTYPES[data_type])
+    if values.dtype.kind not in NATIVE_KINDS[data_type]:
+        raise TypeError(f"Items of dtype {values.dtype} are not instances of {data_type.__name__}.")
+    if not np.can_cast(values.dtype, dtype, casting = 'safe'):
+        if values.dtype.kind != 'u' or values.max() > np.iinfo(dtype).max:
+            raise TypeError(f"Items of dtype {values.dtype} do not fit in {dtype}.")
+    return values
+
+
+class CopyPolicy(Enum):
+    """How an Array copies the items handed to it by the constructor, append, append_front and set_range."""
+    REFERENCE = auto()      # store the caller's object itself
+    SHALLOW = auto()        # copy.copy each item
+    DEEP = auto()           # copy.deepcopy each item (the default)
 
 
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T], data_type: type=object) -> None: 
+    class View(Sequence[T]):
+        """A window over an Array that shares the Array's numpy buffer through an offset and a stride instead of copying items.
+            Reads and writes go straight through to the parent Array. Call copy() to get an independent Array.
+            A view covers the positions that were in the slice when it was made."""
+
+        def __init__(self, array: Array, positions: range) -> None:
+            self.__array = array
+            self.__positions = positions
+
+        def __getitem__(self, index: int | slice) -> T | Array.View[T]:
+            if isinstance(index, int):
+                if index >= len(self) or index < -len(self):
+                    raise IndexError("View index out of range.")
+                return self.__array[self.__positions[index]]
+            elif isinstance(index, slice):
+                return Array.View(self.__array, self.__positions[index])
+            else:
+                raise TypeError("Argument must be an index or a slice.")
+
+        def __setitem__(self, index: int, item: T) -> None:
+            if index >= len(self) or index < -len(self):
+                raise IndexError("View index out of range.")
+            self.__array[self.__positions[index]] = item
+
+        def __len__(self) -> int:
+            return len(self.__positions)
+
+        def __iter__(self) -> Iterator[T]:
+            return iter(self.to_numpy().tolist())
+
+        def __reversed__(self) -> Iterator[T]:
+            return iter(self.to_numpy()[::-1].tolist())
+
+        def __contains__(self, item: Any) -> bool:
+            return item in self.to_numpy()
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, (Array, Array.View)):
+                return False
+            return np.array_equal(self.to_numpy(), other.to_numpy())
+
+        def to_numpy(self) -> NDArray:
+            """Returns a read-only numpy view of the items in the window (no copy)."""
+            stop = self.__positions.stop if self.__positions.stop >= 0 else None   # a stop of -1 means 'run past index 0'
+            return self.__array.get_range()[self.__positions.start:stop:self.__positions.step]
+
+        def copy(self) -> Array[T]:
+            """Materializes the window into a new, independent Array."""
+            return Array.from_numpy(self.to_numpy(), data_type = self.__array.get_data_type(), copy_policy = self.__array.get_copy_policy())
+
+        def __str__(self) -> str:
+            return '[' + ', '.join(str(item) for item in self) + ']'
+
+        def __repr__(self) -> str:
+            return f'Array.View {self.__str__()}, positions: {self.__positions}'
+
+    def __init__(self, starting_sequence: Sequence[T], data_type: type=object, copy_policy: CopyPolicy=CopyPolicy.DEEP,
+                 growth_factor: float=2.0, shrink_threshold: float | None=None) -> None: 
 
         ## ERRORS
         if not isinstance(starting_sequence, Sequence):
@@ -28,30 +151,299 @@ class Array(IArray[T]):
             raise ValueError("Must have a starting sequence. Try Array.empty() to initialize an empty array.")
         if not isinstance(data_type, type):
             raise ValueError(" Data type is not a valid type.")
-        for i in range(len(starting_sequence)):
-            if not isinstance(starting_sequence[i], data_type):
-                raise TypeError("An element of the starting sequence is not an instance of the specified data type.")
+        if not isinstance(copy_policy, CopyPolicy):
+            raise ValueError("Copy policy must be a CopyPolicy.")
+        if growth_factor <= 1:
+            raise ValueError("Growth factor must be greater than 1.")
+        if shrink_threshold is None:
+            shrink_threshold = 1 / growth_factor ** 2       # 0.25 for the default growth factor of 2
+        if not 0 <= shrink_threshold < 1 / growth_factor:     # otherwise a shrink could leave the array full enough to grow right back
+            raise ValueError(f"Shrink threshold must be at least 0 and less than 1 / growth factor ({1 / growth_factor:g}).")
         
         ## INITIALIZE ATTRIBUTES
-        self.__element_count = len(starting_sequence)   # logical size
-        self.__capacity = len(starting_sequence)        # physical size (storage)
+        self.__element_count = 0                        # logical size
+        self.__capacity = 0                             # physical size (storage)
+        self.__head = 0                                 # index of the first item in the internal numpy array, leaves room at the front
+        self.__growth_factor = growth_factor            # physical size is multiplied by this when the array runs out of room
+        self.__shrink_threshold = shrink_threshold      # physical size is divided by the growth factor when the load drops to this (0 never shrinks)
+        self.__reserved = 0                             # physical size set by reserve() that automatic shrinking will not go below
+        self.__shared = False                           # the numpy array is shared with a snapshot and must be copied before the next write
+        self.__frozen = False                           # this Array is a snapshot and can not be changed
         self.__data_type = data_type
+        self.__copy_policy = copy_policy
+        self.__path: str | None = None          # set when the elements live in a memory-mapped file (see from_file)
+        self.__file_mode: str | None = None
+        self.__file_count: NDArray | None = None     # the mapped count field of the file's header (see SAVE_COUNT_OFFSET)
 
         ## CREATE EMPTY ARRAY
-        self.__elements = np.empty(self.__element_count, dtype = data_type)
+        self.__elements = np.empty(0, dtype = NATIVE_DTYPES.get(data_type, object))
 
         ## PLACE ELEMENTS IN ARRAY
-        for i in range(len(starting_sequence)):
-            self.__elements[i] = deepcopy(starting_sequence[i])
+        self.extend(starting_sequence)      # checks the types in bulk and copies with a single block assignment
 
 
-    def empty(elements: int=1, data_type: type=object) -> Array:
+    def empty(elements: int=1, data_type: type=object, copy_policy: CopyPolicy=CopyPolicy.DEEP) -> Array:
         if elements < 1:
             raise ValueError("Element amount must be 1 or above. This will not affect the length of the array.")
         starting_sequence: List[T] = []
         for elem in range(elements):
             starting_sequence.append(data_type())
-        return Array(starting_sequence, data_type)
+        return Array(starting_sequence, data_type, copy_policy)
+
+    @staticmethod
+    def from_numpy(values: NDArray, data_type: type | None=None, copy_policy: CopyPolicy=CopyPolicy.DEEP) -> Array:
+        """Builds an Array from a one-dimensional numpy array with one dtype check and one block copy.
+            When data_type is left out it follows the dtype: bool, int, float and complex dtypes give typed arrays,
+            anything else gives an object array.
+
+        Raises:
+            ValueError: if values is not one-dimensional.
+            TypeError: if the dtype of values can not be stored as data_type without losing information.
+        """
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("Only one-dimensional numpy arrays can become an Array.")
+        if data_type is None:
+            data_type = {'b': bool, 'i': int, 'u': int, 'f': float, 'c': complex}.get(values.dtype.kind, object)
+        array = Array([], data_type = data_type, copy_policy = copy_policy)
+        array.extend(values)
+        return array
+
+    @staticmethod
+    def from_iterable(values: Iterable[T], data_type: type=object, copy_policy: CopyPolicy=CopyPolicy.DEEP) -> Array:
+        """Builds an Array from any iterable (a generator, a file, ...) while consuming it, a block of items at a time,
+            so the input never has to be held in memory as a list first."""
+        array = Array([], data_type = data_type, copy_policy = copy_policy)
+        array.extend(values)
+        return array
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Appends every item of values. numpy arrays, Arrays and views are checked with a single dtype check and copied
+            with a single block assignment; other iterables are consumed in blocks of EXTEND_CHUNK_SIZE items.
+            Typed arrays accept exactly the items append() accepts (see check_native_block).
+
+        Raises:
+            TypeError: if an item can not be stored in the array. Nothing from the failing block is appended.
+        """
+        if isinstance(values, (np.ndarray, Array, Array.View)):
+            self.__extend_block(np.asarray(values))
+            return
+        iterator = iter(values)
+        while block := list(islice(iterator, EXTEND_CHUNK_SIZE)):
+            self.__extend_block(block)
+
+    def __extend_block(self, values: Sequence[T] | NDArray) -> None:
+        """Checks the types of one block of values, makes room once and writes the block behind the last item."""
+        self.__prepare_write()
+        values = self.__check_block(values)
+
+        ## MAKE ROOM
+        needed = self.__element_count + len(values)
+        if self.__head + needed > self.__capacity:
+            self.resize_array(self.grown_capacity(needed))
+
+        ## COPY BLOCK
+        end = self.__head + self.__element_count
+        self.__elements[end:end + len(values)] = values
+        self.__set_count(needed)
+
+    def __check_block(self, values: Sequence[T] | NDArray) -> NDArray:
+        """Checks the types of a block of values in bulk and returns it as a numpy array ready for one slice assignment,
+            with object items already copied according to the copy policy."""
+        if self.is_typed:
+            values = check_native_block(values, self.__data_type)
+            if values.ndim != 1:
+                raise TypeError("Values must be a one-dimensional block of items.")
+        else:
+            if isinstance(values, np.ndarray) and values.dtype != object:
+                values = values.astype(object)     # numpy scalars become plain Python values
+            for value in values:
+                if not isinstance(value, self.__data_type):
+                    raise TypeError("An element is not an instance of the array's specified data type.")
+            if self.__copy_policy is not CopyPolicy.REFERENCE:
+                values = [self.copy_item(value) for value in values]
+            values = np.fromiter(values, dtype = object, count = len(values))     # fromiter never unpacks nested sequences
+        return values
+
+    @staticmethod
+    def from_file(path: str, data_type: type=int, mode: str='r+') -> Array:
+        """Opens an Array whose elements live in a memory-mapped file (np.memmap), so a huge typed array opens instantly
+            and is paged in lazily. The file has the layout save() writes for a typed array: a SAVE_HEADER followed by
+            the raw items, so load() can read it too. The count in the header is the logical size; it is updated in
+            place after every change, so the spare capacity that grows the file on disk as items are appended never
+            comes back as items, even if the process ends without close(). flush() or close() trims the spare capacity.
+
+            Modes: 'r' opens read-only (several processes can share one file), 'r+' opens an existing file for
+            reading and writing, and 'w+' creates (or empties) the file.
+
+        Raises:
+            ValueError: if data_type is not native, mode is unknown, or the file does not hold an array of data_type.
+        """
+        if data_type not in NATIVE_DTYPES:
+            raise ValueError("Only int, float, bool and complex arrays can be backed by a file.")
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("Mode must be 'r', 'r+' or 'w+'.")
+
+        array = Array([], data_type = data_type)
+        if mode == 'w+':
+            with open(path, 'wb') as file:
+                file.write(array.__header())
+        with open(path, 'rb') as file:
+            kind, dtype, count = Array.__read_header(file)
+        if kind != 0 or dtype != array.__elements.dtype:
+            raise ValueError("The file holds an array of a different data type.")
+
+        array.__path = os.fspath(path)
+        array.__file_mode = mode
+        if mode != 'r':
+            array.__file_count = np.memmap(path, dtype = '<u8', mode = 'r+', offset = SAVE_COUNT_OFFSET, shape = (1,))
+        array.__element_count = count
+        if count > 0:
+            array.__elements = np.memmap(path, dtype = dtype, mode = mode, offset = SAVE_HEADER.size, shape = (count,))
+        array.__capacity = count
+        return array
+
+    def map_file(self, capacity: int) -> None:
+        """Re-maps the backing file with room for capacity items. The items are already in the file, so nothing is copied;
+            np.memmap extends the file on disk when it is too short."""
+        if self.__file_mode == 'r':
+            raise ValueError("Array was opened read-only.")
+        if isinstance(self.__elements, np.memmap):
+            self.__elements.flush()
+        if capacity == 0:       # mmap can not map zero bytes
+            self.__elements = np.empty(0, dtype = self.__elements.dtype)
+        else:
+            self.__elements = np.memmap(self.__path, dtype = self.__elements.dtype, mode = 'r+', offset = SAVE_HEADER.size, shape = (capacity,))
+        self.__capacity = capacity
+
+    def flush(self) -> None:
+        """Writes a file-backed Array to disk and trims the file to the header and the logical items."""
+        if self.__path is None:
+            return
+        if isinstance(self.__elements, np.memmap):
+            self.__elements.flush()
+        if self.__file_mode != 'r':
+            self.__file_count.flush()
+            os.truncate(self.__path, SAVE_HEADER.size + self.__element_count * self.__elements.itemsize)
+            self.map_file(self.__element_count)
+
+    def close(self) -> None:
+        """Flushes a file-backed Array and releases the file. The Array is empty afterwards."""
+        if self.__frozen:
+            raise TypeError("A snapshot can not be changed.")
+        self.flush()
+        self.__path = None
+        self.__file_mode = None
+        self.__file_count = None
+        self.__elements = np.empty(0, dtype = self.__elements.dtype)
+        self.__element_count = 0
+        self.__capacity = 0
+        self.__head = 0
+
+    def __enter__(self) -> Array:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def save(self, path: str, append: bool=False) -> None:
+        """Writes the logical items (never the spare capacity) to path in the compact format described at SAVE_HEADER.
+            Typed arrays are written as one raw block; object arrays as one pickle record per item, a record at a time.
+
+            With append=True the file is treated as an earlier checkpoint of this array: only the items past the ones
+            already in the file are written, then the count in the header is updated. The count is written last, so a
+            checkpoint that is interrupted part way still loads as the previous one.
+
+        Raises:
+            ValueError: if the file to append to holds a different kind of array or more items than this one.
+        """
+        if append and os.path.exists(path):
+            with open(path, 'r+b') as file:
+                kind, dtype, saved = Array.__read_header(file)
+                if kind != int(not self.is_typed) or dtype != self.__elements.dtype:
+                    raise ValueError("The file holds an array of a different data type.")
+                if saved > self.__element_count:
+                    raise ValueError("The file holds more items than the array.")
+                if not self.is_typed and Array.__read_record(file) is not self.__data_type:
+                    raise ValueError("The file holds an array of a different data type.")
+                if self.is_typed:       # move past the committed items; bytes after them are from an interrupted append
+                    file.seek(SAVE_HEADER.size + saved * self.__elements.itemsize)
+                else:
+                    for _ in range(saved):
+                        size, = SAVE_RECORD.unpack(file.read(SAVE_RECORD.size))
+                        file.seek(size, os.SEEK_CUR)
+                file.truncate()
+                self.__write_items(file, saved)
+                file.seek(0)
+                file.write(self.__header())
+            return
+        with open(path, 'wb') as file:
+            file.write(self.__header())
+            if not self.is_typed:
+                Array.__write_record(file, self.__data_type)
+            self.__write_items(file, 0)
+
+    def __header(self) -> bytes:
+        return SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, int(not self.is_typed), self.__elements.dtype.str.encode(), self.__element_count)
+
+    def __write_items(self, file: Any, start: int) -> None:
+        items = self.__logical()[start:]
+        if self.is_typed:
+            items.tofile(file)
+        else:
+            for item in items:
+                Array.__write_record(file, item)
+
+    @staticmethod
+    def __write_record(file: Any, item: Any) -> None:
+        record = pickle.dumps(item, protocol = pickle.HIGHEST_PROTOCOL)
+        file.write(SAVE_RECORD.pack(len(record)))
+        file.write(record)
+
+    @staticmethod
+    def __read_record(file: Any) -> Any:
+        size, = SAVE_RECORD.unpack(file.read(SAVE_RECORD.size))
+        return pickle.loads(file.read(size))
+
+    @staticmethod
+    def __read_header(file: Any) -> tuple[int, np.dtype, int]:
+        """Reads and checks the header and returns the kind (0 typed, 1 object), the numpy dtype and the item count."""
+        header = file.read(SAVE_HEADER.size)
+        if len(header) < SAVE_HEADER.size:
+            raise ValueError("File is not a saved Array.")
+        magic, version, kind, dtype, count = SAVE_HEADER.unpack(header)
+        if magic != SAVE_MAGIC or version != SAVE_VERSION:
+            raise ValueError("File is not a saved Array.")
+        return kind, np.dtype(dtype.rstrip(b'\x00').decode()), count
+
+    @staticmethod
+    def load(path: str, mmap: bool=True, copy_policy: CopyPolicy=CopyPolicy.DEEP) -> Array:
+        """Reads an Array written by save(). With mmap=True a typed array maps the file copy-on-write (np.memmap
+            mode 'c') instead of reading it, so loading is instant and pages come in as they are used; changes to the
+            Array never reach the file. Object arrays are read a record at a time.
+
+        Raises:
+            ValueError: if the file was not written by save().
+        """
+        with open(path, 'rb') as file:
+            kind, dtype, count = Array.__read_header(file)
+            if kind == 1:
+                data_type = Array.__read_record(file)
+                array = Array([], data_type = data_type, copy_policy = CopyPolicy.REFERENCE)     # the items are already fresh objects
+                array.extend(Array.__read_record(file) for _ in range(count))
+                array.__copy_policy = copy_policy
+                return array
+            data_type = {'b': bool, 'i': int, 'f': float, 'c': complex}[dtype.kind]
+            array = Array([], data_type = data_type, copy_policy = copy_policy)
+            if count == 0:
+                return array
+            if mmap:
+                elements = np.memmap(path, dtype = dtype, mode = 'c', offset = SAVE_HEADER.size, shape = (count,))
+            else:
+                elements = np.fromfile(file, dtype = dtype, count = count)
+            array.__elements = elements.astype(array.__elements.dtype, copy = False)
+            array.__element_count = array.__capacity = count
+            return array
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -61,74 +453,265 @@ class Array(IArray[T]):
     
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
         if isinstance(index, int):          # if index
-            return self.__elements[index].item() if isinstance(self.__elements[index], np.generic) else self.__elements[index]
-        elif isinstance(index, slice):      # if slice
-            return Array([elem.item() if isinstance(elem, np.generic) else elem for elem in self.__elements[index]], data_type = self.__data_type)
+            item = self.__elements[self.map_index(index)]
+            return item.item() if isinstance(item, np.generic) else item
+        elif isinstance(index, slice):      # if slice, hand back a view over the same buffer instead of copying
+            return Array.View(self, range(self.__element_count)[index])
         else:
             raise TypeError("Argument must be an index or a slice.")
       
 
     def __setitem__(self, index: int, item: T) -> None:
+        self.__prepare_write()
         if not isinstance(item, self.__data_type):
             raise TypeError("Item is not an instance of the specified data type.")
-        self.__elements[index] = item
+        self.__elements[self.map_index(index)] = item
+
+    @property
+    def is_typed(self) -> bool:
+        """True when the elements are packed in a native numpy dtype (int, float, bool, complex) rather than stored as objects."""
+        return self.__elements.dtype != object
+
+    def get_range(self, start: int=0, stop: int | None=None) -> NDArray:
+        """Returns a read-only numpy view of the items from start up to (not including) stop without copying or boxing them."""
+        start, stop, _ = slice(start, stop).indices(self.__element_count)
+        view = self.__logical()[start:max(start, stop)]
+        view.flags.writeable = False
+        return view
+
+    def set_range(self, start: int, values: Sequence[T] | NDArray) -> None:
+        """Overwrites the items starting at start with values using a single numpy slice assignment.
+            The types of values are checked in bulk, the same way extend() checks them."""
+        self.__prepare_write()
+        if start < 0:
+            start += self.__element_count
+        if start < 0 or start + len(values) > self.__element_count:
+            raise IndexError("Values do not fit inside the array.")
+        values = self.__check_block(values)
+        self.__logical()[start:start + len(values)] = values
+
+    def sum(self) -> T:
+        """Adds up all of the items. Typed arrays reduce in numpy without creating a Python object per item."""
+        if self.is_typed:
+            return self.__logical().sum().item()
+        return sum(self.__logical())
+
+    def min(self) -> T:
+        """Returns the smallest item. Raises ValueError if the array is empty."""
+        if self.__element_count == 0:
+            raise ValueError("min() of an empty array.")
+        if self.is_typed:
+            return self.__logical().min().item()
+        return min(self.__logical())
+
+    def max(self) -> T:
+        """Returns the largest item. Raises ValueError if the array is empty."""
+        if self.__element_count == 0:
+            raise ValueError("max() of an empty array.")
+        if self.is_typed:
+            return self.__logical().max().item()
+        return max(self.__logical())
+
+    def argmax(self) -> int:
+        """Returns the index of the first occurrence of the largest item. Raises ValueError if the array is empty."""
+        if self.__element_count == 0:
+            raise ValueError("argmax() of an empty array.")
+        if self.is_typed:
+            return int(self.__logical().argmax())
+        items = self.__logical()
+        return max(range(self.__element_count), key = lambda i: items[i])
+
+    def parallel_map(self, fn: Callable[[T], Any], workers: int | None=None, chunk_size: int | None=None,
+                     data_type: type | None=None) -> Array:
+        """Applies fn to every item in a process pool and returns a new Array of the results, in the same order.
+            The items are split into chunks of chunk_size (about four per worker by default); typed arrays share
+            their items with the workers through shared memory, object arrays send each worker a pickled chunk.
+            fn must be picklable (a module-level function, not a lambda). The result's data type defaults to this one's.
+        """
+        results = run_chunks(map_chunk, fn, self.get_range(), workers, chunk_size) if self.__element_count else []
+        return Array.from_iterable(chain.from_iterable(results), data_type = data_type or self.__data_type,
+                                   copy_policy = CopyPolicy.REFERENCE)
+
+    def parallel_reduce(self, fn: Callable[[Any, T], Any], initial: Any, workers: int | None=None,
+                        chunk_size: int | None=None) -> Any:
+        """Folds the items with fn in a process pool, chunked the same way as parallel_map: every chunk is reduced on
+            its own, then the chunk results are folded in order starting from initial. fn must be associative (like
+            addition or max) and picklable. Returns initial if the array is empty."""
+        partials = run_chunks(reduce_chunk, fn, self.get_range(), workers, chunk_size) if self.__element_count else []
+        return reduce(fn, partials, initial)
+
+    def memory_usage(self) -> int:
+        """Returns the number of bytes held by the array: the whole internal numpy array (spare capacity included)
+            plus, for object arrays, the Python objects that the logical items point to."""
+        total = self.__elements.nbytes
+        if not self.is_typed:
+            total += sum(sys.getsizeof(item) for item in self.__logical())
+        return total
+
+    def stream(self) -> ArrayStream[T]:
+        """Returns a lazy ArrayStream over the items. Its map, filter, take, skip and chunk stages run in one pass
+            when collect(), to_array() or iteration asks for the results, so no Array is built between stages."""
+        from datastructures.arraystream import ArrayStream     # imported here because arraystream imports this module
+        return ArrayStream(self)
+
+    def snapshot(self) -> Array[T]:
+        """Returns a read-only Array holding the items as they are now, in O(1): it shares this Array's numpy array,
+            and this Array copies the numpy array only on its first write after the snapshot, so memory only grows
+            when something actually changes. Object arrays share the item objects themselves, just like a shallow copy.
+            File-backed arrays copy their items into the snapshot right away, since the file can be changed by others.
+
+        Examples:
+            >>> array = Array[int](starting_sequence=[1, 2, 3], data_type=int)
+            >>> version = array.snapshot()
+            >>> array[0] = 100
+            >>> print(version)
+            [1, 2, 3]
+        """
+        if self.__frozen:
+            return self
+        snapshot = Array([], data_type = self.__data_type, copy_policy = self.__copy_policy)
+        if self.__path is not None:
+            buffer, head = np.array(self.__logical()), 0
+        else:
+            buffer, head = self.__elements.view(), self.__head
+            self.__shared = True
+        buffer.flags.writeable = False
+        snapshot.__elements = buffer
+        snapshot.__head = head
+        snapshot.__element_count = self.__element_count
+        snapshot.__capacity = len(buffer)
+        snapshot.__frozen = True
+        return snapshot
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.__frozen
+
+    def __prepare_write(self, keep_items: bool=True) -> None:
+        """Called before anything changes the Array: refuses to change a snapshot or a read-only file, and gives an Array whose numpy array
+            is shared with a snapshot its own copy (unless the items are about to be thrown away anyway)."""
+        if self.__frozen:
+            raise TypeError("A snapshot can not be changed.")
+        if self.__file_mode == 'r':
+            raise ValueError("Array was opened read-only.")
+        if self.__shared:
+            if keep_items:
+                self.__elements = self.__elements.copy()
+            self.__shared = False
+
+    def __set_count(self, count: int) -> None:
+        """Sets the logical size and, for a file-backed Array, the count in the file's header. Callers write the items
+            first and the count last, so the file always describes a complete array."""
+        self.__element_count = count
+        if self.__file_count is not None:
+            self.__file_count[0] = count
+
+    def __check_resizable(self) -> None:
+        """The checks of __prepare_write for changes that only move the items into a new numpy array, which needs
+            no copy of a buffer shared with a snapshot first."""
+        if self.__frozen:
+            raise TypeError("A snapshot can not be changed.")
+        if self.__file_mode == 'r':
+            raise ValueError("Array was opened read-only.")
+
+    def __logical(self) -> NDArray:
+        """The writable slice of the internal numpy array that holds the logical items."""
+        return self.__elements[self.__head:self.__head + self.__element_count]
+
+    def map_index(self, index: int) -> int:
+        """Takes a logical index (negative indexes wrap around) and returns its position in the internal numpy array."""
+        if index < -self.__element_count or index >= self.__element_count:
+            raise IndexError("Index out of range.")
+        return self.__head + (index + self.__element_count if index < 0 else index)
+
+    def resize_array(self, capacity: int, head: int=0) -> None:
+        """Moves the elements into a new numpy array with the given physical size using a single block copy.
+            The first item lands at index head, so the caller decides how much room is left at the front."""
+        if self.__path is not None:     # file-backed arrays resize the mapping instead and always start at the front of the file
+            self.map_file(capacity)
+            return
+        new_array = np.empty(capacity, dtype = self.__elements.dtype)
+        new_array[head:head + self.__element_count] = self.__logical()
+        self.__elements = new_array
+        self.__shared = False
+        self.__capacity = capacity
+        self.__head = head
 
     def grow_array(self) -> None:
-        if self.__element_count == self.__capacity:     # if array has reached capacity, double capacity
-            if self.__capacity == 0:
-                self.__capacity == 1
+        if self.__head + self.__element_count == self.__capacity:     # if there is no room left at the back
+            if 0 < self.__capacity and self.__element_count * 2 <= self.__capacity:     # at least half empty, so slide the items to the front instead of growing
+                self.resize_array(self.__capacity)
             else:
-                self.__capacity *= 2
-            new_array = np.empty(self.__capacity, dtype = self.__data_type)  # create new empty array
-
-            for i in range(len(self)):              # copy over elements
-                new_array[i] = deepcopy(self[i])
-            self.__elements = deepcopy(new_array)  
+                self.resize_array(self.grown_capacity(self.__element_count + 1))
 
 
     def append(self, data: T) -> None:
+        self.__prepare_write()
         if not isinstance(data, self.__data_type):
             raise TypeError("Item is not an instance of the array's specified data type.")
 
         self.grow_array()   # will grow array if needed
 
         ## APPEND ELEMENT
-        self.__element_count += 1
-        self[len(self) - 1] = deepcopy(data)    # append new element
-        self.__elements = deepcopy(self)    # update self.__elements
+        self.__elements[self.__head + self.__element_count] = self.copy_item(data)    # write straight into the first free slot
+        self.__set_count(self.__element_count + 1)
 
     
     def append_front(self, data: T) -> None:
+        self.__prepare_write()
         if not isinstance(data, self.__data_type):
             raise TypeError("Item is not an instance of the array's specified data type.")
 
-        self.grow_array()   # will grow array if needed
+        if self.__path is not None:     # file-backed arrays keep their first item at the start of the file, so shift with one block move
+            self.grow_array()
+            self.__elements[1:self.__element_count + 1] = self.__elements[:self.__element_count]
+            self.__head = 1
+        elif self.__head == 0:     # no room left at the front: re-center the items, doubling the physical size if more than half full
+            capacity = self.__capacity if 0 < self.__capacity and self.__element_count * 2 <= self.__capacity else self.grown_capacity(self.__element_count + 1)
+            self.resize_array(capacity, head = (capacity - self.__element_count + 1) // 2)
         
         ## APPEND ELEMENT
-        for i in range(len(self)):   # shift everything forward 1 space, thereby leaving space for the element to be appended
-            self[i + 1] = deepcopy(self[i])
-        self[0] = deepcopy(data)    # append new element to first position
-        self.__element_count += 1
-        self.__elements = deepcopy(self)
+        self.__head -= 1
+        self.__elements[self.__head] = self.copy_item(data)    # the new first position
+        self.__set_count(self.__element_count + 1)
 
 
-    def shrink_array(self) -> None:
-        if self.__element_count <= 0.25 * self.__capacity:  # check if capacity has outgrown elements
-            self.__capacity = self.__capacity // 2
-            new_array = np.empty(self.__capacity, dtype = self.__data_type)     # create empty array of new size
+    def grown_capacity(self, needed: int) -> int:
+        """The physical size to grow to so that at least needed items fit, growing geometrically by the growth factor."""
+        return max(needed, math.ceil(self.__capacity * self.__growth_factor), 1)
 
-            for i in range(len(self)):              # copy over elements
-                new_array[i] = deepcopy(self[i])
-            self.__elements = deepcopy(new_array)
+    def shrink_array(self) -> None:
+        floor = max(self.__reserved, 1)     # never shrink to nothing, or alternating append and pop would reallocate every time
+        if self.__element_count <= self.__shrink_threshold * self.__capacity and self.__capacity > floor:  # check if capacity has outgrown elements
+            capacity = max(floor, int(self.__capacity / self.__growth_factor))
+            self.resize_array(capacity, head = (capacity - self.__element_count) // 2)    # keep room at both ends
+
+    def reserve(self, capacity: int) -> None:
+        """Makes sure capacity items fit without another resize (at most one block copy now), and stops automatic
+            shrinking from going below capacity until shrink_to_fit() is called."""
+        if capacity < 0:
+            raise ValueError("Capacity can not be negative.")
+        self.__check_resizable()
+        self.__reserved = capacity
+        if self.__head + capacity > self.__capacity and capacity > self.__element_count:
+            self.resize_array(max(capacity, self.__capacity))
+
+    def shrink_to_fit(self) -> None:
+        """Releases all spare capacity (a single block copy) and cancels any earlier reserve()."""
+        self.__check_resizable()
+        self.__reserved = 0
+        if self.__capacity != self.__element_count:
+            self.resize_array(self.__element_count)
 
 
     def pop(self) -> None:
-        popped = deepcopy(self[len(self) - 1])  # store the last element somewhere else before it's deleted
+        self.__prepare_write()
+        popped = self[len(self) - 1]  # the slot is discarded, so the item can be handed back without a copy
 
         ## DELETE ELEMENT
-        self[len(self) - 1] = self.__data_type()   # replace element w/ generic version of the data type
-        self.__element_count -= 1
-        self.__elements = deepcopy(self)
+        if not self.is_typed:
+            self.__elements[self.map_index(-1)] = None     # drop the array's reference to the item
+        self.__set_count(self.__element_count - 1)
 
         self.shrink_array()     # shrink array if needed
 
@@ -136,70 +719,275 @@ class Array(IArray[T]):
 
     
     def pop_front(self) -> None:
-        popped = deepcopy(self[0])  # store the first element somewhere else before it's deleted
+        self.__prepare_write()
+        popped = self[0]  # the slot is discarded, so the item can be handed back without a copy
 
         ## DELETE ELEMENT
-        for i in range(len(self)):   # shift everything back 1, thereby overwriting the first element
-            self[i - 1] = deepcopy(self[i])
-            # last element is now written twice - in its previous position and back 1 since nothing shifted back to overwrite it
-        self.__element_count -= 1
-        self[len(self) - 1] = self.__data_type()    # replace 2nd instance of last element w/ generic instance of data type
-        self.__elements = deepcopy(self)
+        if not self.is_typed:
+            self.__elements[self.__head] = None     # drop the array's reference to the item
+        if self.__path is not None:     # file-backed arrays keep their first item at the start of the file
+            self.__elements[:self.__element_count - 1] = self.__elements[1:self.__element_count]
+        else:
+            self.__head += 1    # the slot becomes room at the front
+        self.__set_count(self.__element_count - 1)
 
         self.shrink_array()     # shrink array if needed
 
         return popped
 
 
+    def insert(self, index: int, value: T) -> None:
+        """Inserts value before index (index may equal the length to insert at the end) with a single block move.
+            When there is free room before the first item (left by pop_front or append_front) and index is in the
+            front half, the items before index move one slot toward the front; otherwise the items from index on
+            move one slot toward the back, so an array with no front room always moves its back part."""
+        self.__prepare_write()
+        if not isinstance(value, self.__data_type):
+            raise TypeError("Item is not an instance of the array's specified data type.")
+        if index < 0:
+            index += self.__element_count
+        if index < 0 or index > self.__element_count:
+            raise IndexError("Index out of range.")
+
+        if self.__head > 0 and self.__path is None and index < self.__element_count // 2:     # move the front part one slot toward the front
+            self.__head -= 1
+            self.__elements[self.__head:self.__head + index] = self.__elements[self.__head + 1:self.__head + index + 1]
+        else:                                                                                   # move the back part one slot toward the back
+            self.grow_array()
+            position = self.__head + index
+            self.__elements[position + 1:self.__head + self.__element_count + 1] = self.__elements[position:self.__head + self.__element_count]
+        self.__elements[self.__head + index] = self.copy_item(value)
+        self.__set_count(self.__element_count + 1)
+
+    def insert_many(self, index: int, values: Iterable[T]) -> None:
+        """Inserts all of values before index, checking their types in bulk and moving the items behind index only once."""
+        self.__prepare_write()
+        if index < 0:
+            index += self.__element_count
+        if index < 0 or index > self.__element_count:
+            raise IndexError("Index out of range.")
+        block = self.__check_block(values if isinstance(values, (Sequence, np.ndarray)) else list(values))
+
+        needed = self.__element_count + len(block)
+        if self.__head + needed > self.__capacity:
+            self.resize_array(self.grown_capacity(needed))
+        position = self.__head + index
+        end = self.__head + self.__element_count
+        self.__elements[position + len(block):end + len(block)] = self.__elements[position:end]    # one block move opens the gap
+        self.__elements[position:position + len(block)] = block
+        self.__set_count(needed)
+
+    def delete_many(self, indices: Iterable[int]) -> None:
+        """Deletes the items at all of indices (negative indexes wrap around, repeats are ignored) in one pass
+            that moves every remaining item at most once.
+
+        Raises:
+            TypeError: if indices are not integers (a mask of bools goes to delete_where() instead).
+            IndexError: if an index is out of range.
+        """
+        positions = indices if isinstance(indices, np.ndarray) else np.asarray(list(indices))
+        if positions.size and positions.dtype.kind not in 'iu':
+            raise TypeError(f"Indices must be integers, not {positions.dtype}. Use delete_where() to delete with a mask.")
+        if positions.size and (positions.min() < -self.__element_count or positions.max() >= self.__element_count):
+            raise IndexError("Index out of range.")
+        keep = np.ones(self.__element_count, dtype = bool)
+        keep[positions.astype(np.intp, copy = False)] = False
+        self.__compact(keep)
+
+    def delete_where(self, predicate_or_mask: Any) -> int:
+        """Deletes every item for which predicate_or_mask is true, keeping the order of the rest, and returns how many were deleted.
+            predicate_or_mask is either a function called with each item or a sequence of bools with one entry per item,
+            such as a numpy comparison of get_range(), which keeps the whole filter vectorized."""
+        if callable(predicate_or_mask):
+            items = self.__logical().tolist()
+            remove = np.fromiter((bool(predicate_or_mask(item)) for item in items), dtype = bool, count = len(items))
+        else:
+            remove = np.asarray(predicate_or_mask, dtype = bool)
+            if remove.shape != (self.__element_count,):
+                raise ValueError("Mask must have one entry per item.")
+        self.__compact(~remove)
+        return int(np.count_nonzero(remove))
+
+    def __compact(self, keep: NDArray) -> None:
+        """Packs the items marked in keep toward the front with a single block copy, then shrinks if needed."""
+        self.__prepare_write()
+        items = self.__logical()
+        kept = items[keep]
+        items[:len(kept)] = kept
+        if not self.is_typed:
+            items[len(kept):] = None     # drop the array's references to the deleted items
+        self.__set_count(len(kept))
+        self.shrink_array()
+
     def __len__(self) -> int: 
         return(self.__element_count)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Array):
+        if not isinstance(other, (Array, Array.View)):
             return False
         #return self.__elements.all() == other.__elements.all()
-        return np.array_equal(self.__elements, other.__elements)
+        return np.array_equal(self.__logical(), other.to_numpy())
         
     def __iter__(self) -> Iterator[T]:
-        return(self.__elements.__iter__())
+        """Yields the logical items as native Python values (int, not numpy.int64), converting a chunk at a time."""
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
 
     def __reversed__(self) -> Iterator[T]:
-        rev = self.__elements[::-1]
-        return(rev.__iter__())
+        items = self.get_range()
+        for stop in range(len(items), 0, -ITER_CHUNK_SIZE):
+            yield from items[max(0, stop - ITER_CHUNK_SIZE):stop][::-1].tolist()
+
+    def iter_chunks(self, size: int=ITER_CHUNK_SIZE) -> Iterator[NDArray]:
+        """Yields the logical items as read-only numpy views of at most size items each, for vector work on big arrays."""
+        if size < 1:
+            raise ValueError("Chunk size must be 1 or above.")
+        items = self.get_range()
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
 
 
     def __delitem__(self, index: int) -> None:
-        for i in range(index, len(self) - 1):   # shift everything after the deleted item back 1, thereby overwriting the deleted item
-            self[i - 1] = self[i]
-        self.__element_count -= 1
+        self.__prepare_write()
+        position = self.map_index(index) - self.__head
+        items = self.__logical()
+        items[position:-1] = items[position + 1:]    # shift everything after the deleted item back 1 in one block move
+        if not self.is_typed:
+            items[-1] = None     # drop the array's reference to the duplicate left at the end
+        self.__set_count(self.__element_count - 1)
 
-        if self.__element_count <= 0.25 * self.__capacity:  # check if capacity has outgrown elements
-            self.__capacity *= 0.5
-            new_array = np.empty(self.__capacity, dtype = self.__data_type)     # create empty array of new size
-            
-            for i in range(len(self)):              # copy over elements
-                new_array[i] = deepcopy(self[i])
-            self.__elements = deepcopy(new_array)
+        self.shrink_array()     # shrink array if needed
 
 
     def __contains__(self, item: Any) -> bool:
-        return item in self.__elements
+        return bool(self.__equal_mask(item, self.__logical()).any())
+
+    def sort(self, key: Any=None, reverse: bool=False) -> None:
+        """Sorts the items in place. Typed arrays without a key use numpy's stable sort kernel; otherwise the items are
+            reordered by one stable Python sort of their positions, moving references without copying any item."""
+        self.__prepare_write()
+        items = self.__logical()
+        if self.is_typed and key is None:
+            items.sort(kind = 'stable')
+            if reverse:
+                items[:] = items[::-1].copy()     # equal numbers can not be told apart, so flipping keeps it stable
+            return
+        values = items.tolist()
+        keys = values if key is None else [key(value) for value in values]
+        order = sorted(range(len(values)), key = keys.__getitem__, reverse = reverse)
+        items[:] = items[order]
+
+    def __equal_mask(self, value: Any, items: NDArray) -> NDArray:
+        """Marks which of items equal value. Typed arrays compare in numpy; object arrays fall back to comparing
+            item by item (identity first, like a Python list), since numpy would try to unpack sequence values."""
+        if self.is_typed:
+            if not isinstance(value, (bool, int, float, complex, np.number, np.bool_)):
+                return np.zeros(len(items), dtype = bool)     # a non-number never equals a packed number
+            return items == value
+        return np.fromiter((item is value or item == value for item in items), dtype = bool, count = len(items))
+
+    def index(self, value: Any, start: int=0, stop: int | None=None) -> int:
+        """Returns the index of the first item equal to value between start and stop (slice rules apply).
+
+        Raises:
+            ValueError: if value is not found.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__element_count)
+        mask = self.__equal_mask(value, self.__logical()[start:max(start, stop)])
+        position = int(mask.argmax()) if len(mask) > 0 else 0
+        if len(mask) == 0 or not mask[position]:
+            raise ValueError(f"{value!r} is not in the array.")
+        return start + position
+
+    def count(self, value: Any) -> int:
+        """Returns how many items equal value."""
+        return int(np.count_nonzero(self.__equal_mask(value, self.__logical())))
+
+    def find_all(self, value: Any) -> NDArray:
+        """Returns a numpy array with the index of every item equal to value, in increasing order."""
+        return np.flatnonzero(self.__equal_mask(value, self.__logical()))
+
+    def contains_many(self, values: Iterable[Any]) -> NDArray:
+        """Checks many values at once and returns a numpy array of bools, one per value, saying whether it is in the array.
+            Typed arrays use np.isin; object arrays build one set of the items (or compare item by item if they are not hashable)."""
+        values = list(values)
+        if self.is_typed:
+            candidates = np.asarray(values)
+            if candidates.dtype.kind not in 'biufc':     # some values are not numbers, so compare them as objects
+                candidates = np.fromiter(values, dtype = object, count = len(values))
+            return np.isin(candidates, self.__logical())
+        try:
+            lookup = set(self.__logical())
+            return np.fromiter((value in lookup for value in values), dtype = bool, count = len(values))
+        except TypeError:
+            return np.fromiter((value in self for value in values), dtype = bool, count = len(values))
 
 
     def clear(self) -> None:
-        self.__element_count = 0
-        self.__capacity = 0
-        self.__elements = np.empty(self.__element_count, dtype = self.__data_type)
+        self.__prepare_write(keep_items = False)
+        if self.__path is not None:
+            self.map_file(self.__reserved)
+        else:
+            self.__elements = np.empty(self.__reserved, dtype = self.__elements.dtype)     # keep any reserved room
+        self.__set_count(0)
+        self.__capacity = self.__reserved
+        self.__head = 0
         # raise NotImplementedError('Clear not implemented.')
 
     def get_capacity(self) -> int:
         return self.__capacity
 
+    def get_data_type(self) -> type:
+        return self.__data_type
+
+    def get_copy_policy(self) -> CopyPolicy:
+        return self.__copy_policy
+
+    def copy_item(self, item: T) -> T:
+        """Copies item the way the array's copy policy says. Typed arrays hold plain numbers, which never need copying."""
+        if self.__copy_policy is CopyPolicy.REFERENCE or self.__data_type in NATIVE_DTYPES:
+            return item
+        if self.__copy_policy is CopyPolicy.SHALLOW:
+            return copy(item)
+        return deepcopy(item)
+
+    def to_numpy(self) -> NDArray:
+        """Returns a read-only numpy view of all of the logical items."""
+        return self.get_range()
+
+    def __array__(self, dtype: Any=None, copy: bool | None=None) -> NDArray:
+        """Lets np.asarray(array) see the logical items (never the spare capacity) without copying them."""
+        view = self.get_range()
+        if dtype is not None and np.dtype(dtype) != view.dtype:
+            if copy is False:
+                raise ValueError("Converting to the requested dtype needs a copy, but copy=False was given.")
+            return view.astype(dtype)
+        return view.copy() if copy else view
+
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """Numpy array interface for typed arrays, limited to the logical items. The data entry is the read-only
+            view itself, so the exported memory stays valid even if the Array later moves to a bigger buffer."""
+        if not self.is_typed:
+            raise AttributeError("Object arrays are exported through __array__ instead.")
+        view = self.get_range()
+        interface = dict(view.__array_interface__)
+        interface['data'] = view
+        return interface
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Python buffer protocol (Python 3.12+) over the logical items of a typed array, so memoryview(array)
+            and file.write(array) read the packed numpy memory directly."""
+        if not self.is_typed:
+            raise TypeError("Only typed arrays export a buffer.")
+        return memoryview(self.get_range())
+
     def get_elements(self) -> NDArray:
         return self.__elements
 
     def set_element_count(self, num: int) -> None:
-        self.__element_count = num
+        self.__prepare_write()
+        self.__set_count(num)
 
     def __str__(self) -> str:
         return '[' + ', '.join(str(item) for item in self) + ']'
@@ -1,9 +1,12 @@
 from __future__ import annotations
+import hashlib
 import os
-from typing import Iterator, Sequence
+from collections.abc import Iterable
+from typing import Any, Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
 
-from datastructures.iarray import IArray
-from datastructures.array import Array
+from datastructures.array import NATIVE_DTYPES, check_native_block
 from datastructures.iarray2d import IArray2D, T
 from copy import deepcopy
 
@@ -11,113 +14,353 @@ from copy import deepcopy
 class Array2D(IArray2D[T]):
 
     class Row(IArray2D.IRow[T]):
-        def __init__(self, row_index: int, array: IArray, num_columns: int, data_type=object) -> None:
+        """One row of an Array2D. It holds a numpy view of the row, so reading and writing go straight to the
+            Array2D's buffer without any index arithmetic."""
+
+        def __init__(self, row_index: int, array: NDArray, num_columns: int, data_type=object, version: list[int] | None=None) -> None:
             self.__index = row_index
-            self.__array = array
+            self.__array = array        # view of this row in the Array2D's 2-D numpy array
             self.__num_columns = num_columns
             self.__data_type = data_type
+            self.__version = version if version is not None else [0]     # the Array2D's write counter
 
         def __getitem__(self, column_index: int) -> T:
+            item = self.__array[column_index]       # numpy checks the bounds and raises IndexError
+            return item.item() if isinstance(item, np.generic) else item
+
+        def __setitem__(self, column_index: int, value: T) -> None:
             if column_index >= len(self) or column_index < -len(self):
                 raise IndexError("Column index out of range.")
+            if not isinstance(value, self.__data_type):
+                raise TypeError("Item is not an instance of the specified data type.")
+            self.__array[column_index] = value
+            self.__version[0] += 1
 
-            index = self.map_index(column_index)
-            return self.__array[index]
-        
-        def __setitem__(self, column_index: int, value: T) -> None:
-            index = self.map_index(column_index)
-            self.__array[index] = value
-        
         def __iter__(self) -> Iterator[T]:
-            for column_index in range(self.__num_columns):
-                yield self[column_index]
-        
+            return iter(self.__array.tolist())
+
         def __reversed__(self) -> Iterator[T]:
-            for column_index in range(-1, (-self.__num_columns) - 1, -1):
-                yield self[column_index]
+            return iter(self.__array[::-1].tolist())
 
         def __len__(self) -> int:
             return self.__num_columns
-        
+
         def __str__(self) -> str:
-            return f"[{', '.join([str(self[column_index]) for column_index in range(self.__num_columns)])}]"
-        
+            return f"[{', '.join(str(item) for item in self)}]"
+
         def __repr__(self) -> str:
-            return f'Row {self.__index}: [{", ".join([str(self[column_index]) for column_index in range(self.__num_columns - 1)])}, {str(self[self.__num_columns - 1])}]'
+            return f'Row {self.__index}: {str(self)}'
 
         def map_index(self, column_index: int) -> int:
-            """Takes the index of an item within the row and returns the index of that item in the overarching 1D array."""
+            """Takes the index of an item within the row and returns the index of that item in the flattened (row by row) array."""
             index1d = self.__index * self.__num_columns + column_index
             return index1d
 
-    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object) -> None:
-        ## CHECK FOR ERRORS
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object, order: str='C') -> None:
+        ## CHECK FOR ERRORS (one pass over the rows)
         if not isinstance(starting_sequence, Sequence) or isinstance(starting_sequence, str):
             raise ValueError("Starting sequence is not a valid sequence.")
+        Array2D.__check_order(order)
 
-        for i in range(len(starting_sequence)):
-            if not isinstance(starting_sequence[i], Sequence):
+        for row in starting_sequence:
+            if not isinstance(row, Sequence):
                 raise ValueError("Starting sequence must be a sequence of sequences.")
-
-        for i in range(1, len(starting_sequence)):
-            if len(starting_sequence[i]) != len(starting_sequence[0]):
+            if len(row) != len(starting_sequence[0]):
                 raise ValueError("All inner sequences must be the same size.")
-
-        for i in range(len(starting_sequence)):
-            for j in range(len(starting_sequence[0])):
-                if not isinstance(starting_sequence[i][j], data_type):
-                    raise ValueError("All items must be instances of the specified data type.")
+            if not all(isinstance(item, data_type) for item in row):
+                raise ValueError("All items must be instances of the specified data type.")
 
         ## INITIALIZE ATTRIBUTES
         self.__data_type = data_type
-        self.__row_len = len(starting_sequence[0])
-        self.__col_len = len(starting_sequence)
+        self.__rows = len(starting_sequence)
+        self.__cols = len(starting_sequence[0]) if self.__rows > 0 else 0
+        self.__row_cache: list[Array2D.Row | None] = [None] * self.__rows     # Row proxies, made the first time each row is used
+        self.__version = [0]        # counts writes; shared (a one item list) with the Rows and sub-blocks that write to the same buffer
+        self.__hash: tuple[int, int] | None = None      # (version, content hash) from the last content_hash() of a typed array
+
+        ## PLACE ITEMS IN A (rows, cols) NUMPY ARRAY
+        if data_type in NATIVE_DTYPES:
+            self.__elements = np.array(starting_sequence, dtype = NATIVE_DTYPES[data_type], order = order).reshape(self.__rows, self.__cols, order = 'A')
+        else:
+            self.__elements = np.empty((self.__rows, self.__cols), dtype = object, order = order)
+            for row_index, row in enumerate(starting_sequence):
+                Array2D.__fill_row(self.__elements[row_index], row)
+
+    @staticmethod
+    def __from_buffer(elements: NDArray, data_type: type, version: list[int] | None=None) -> Array2D:
+        """Wraps an existing (rows, cols) numpy array in an Array2D without copying or checking it.
+            A view of another Array2D's buffer passes that array's version so writes through either one are seen by both."""
+        array = Array2D.__new__(Array2D)
+        array.__data_type = data_type
+        array.__rows, array.__cols = elements.shape
+        array.__elements = elements
+        array.__row_cache = [None] * array.__rows
+        array.__version = version if version is not None else [0]
+        array.__hash = None
+        return array
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Leaves the Row proxies out of copies and pickles: they hold views of this array's buffer, not of the copy's."""
+        state = self.__dict__.copy()
+        if '_Array2D__row_cache' in state:      # subclasses like Grid may never run Array2D.__init__
+            state['_Array2D__row_cache'] = [None] * len(state['_Array2D__row_cache'])
+        return state
+
+    @staticmethod
+    def __check_order(order: str) -> None:
+        if order not in ('C', 'F'):
+            raise ValueError("Order must be 'C' (row-major) or 'F' (column-major).")
+
+    @staticmethod
+    def __fill_row(target: NDArray, row: Sequence[T]) -> None:
+        """Copies one row into an object row of the buffer an item at a time, so items that are sequences themselves
+            are stored as they are instead of being unpacked by numpy."""
+        for col_index, item in enumerate(row):
+            target[col_index] = item
+
+    @staticmethod
+    def __native_data_type(dtype: np.dtype) -> type:
+        return {'b': bool, 'i': int, 'u': int, 'f': float, 'c': complex}.get(dtype.kind, object)
+
+    @staticmethod
+    def from_numpy(values: NDArray, data_type: type | None=None, order: str='C') -> Array2D:
+        """Builds an Array2D from a two-dimensional numpy array with one dtype check and one block copy.
+            When data_type is left out it follows the dtype, like Array.from_numpy. order picks the memory layout.
+
+        Raises:
+            ValueError: if values is not two-dimensional.
+            TypeError: if the items can not be stored as data_type without losing information.
+        """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError("Only two-dimensional numpy arrays can become an Array2D.")
+        Array2D.__check_order(order)
+        if data_type is None:
+            data_type = Array2D.__native_data_type(values.dtype)
+        if data_type in NATIVE_DTYPES:
+            check_native_block(values, data_type)
+            return Array2D.__from_buffer(np.array(values, dtype = NATIVE_DTYPES[data_type], order = order), data_type)
+        if not all(isinstance(item, data_type) for item in values.flat):
+            raise TypeError("An item is not an instance of the specified data type.")
+        return Array2D.__from_buffer(np.array(values, dtype = object, order = order), data_type)
+
+    @staticmethod
+    def from_rows(rows: Iterable[Sequence[T]], data_type: type=object, order: str='C') -> Array2D:
+        """Builds an Array2D from any iterable of rows (a generator, a csv reader, ...) while consuming it. Typed rows
+            are checked and converted a whole row at a time with numpy; the first row sets the number of columns.
 
-        ## INITIALIZE EMPTY ARRAY2D
-        self.__array1d = Array([data_type() for i in range(self.__row_len * self.__col_len)], data_type = data_type)
+        Raises:
+            ValueError: if the rows are not all the same length.
+            TypeError: if an item can not be stored as data_type.
+        """
+        Array2D.__check_order(order)
+        dtype = NATIVE_DTYPES.get(data_type, object)
+        converted: list[NDArray] = []
+        for row in rows:
+            if dtype is object:
+                if not all(isinstance(item, data_type) for item in row):
+                    raise TypeError("An item is not an instance of the specified data type.")
+                values = np.empty(len(row), dtype = object)
+                Array2D.__fill_row(values, row)
+            else:
+                values = check_native_block(row, data_type).astype(dtype, copy = False)
+            if values.ndim != 1 or (converted and len(values) != len(converted[0])):
+                raise ValueError("All rows must be the same size.")
+            converted.append(values)
+        if not converted:
+            return Array2D.__from_buffer(np.empty((0, 0), dtype = dtype), data_type)
+        elements = np.stack(converted)
+        return Array2D.__from_buffer(np.asfortranarray(elements) if order == 'F' else elements, data_type)
 
-        ## ADD ITEMS TO ARRAY2D
-        index = 0                   # initialize 1d index
-        for row_index in range(self.__row_len):
-            for col_index in range(self.__col_len):
-                self.__array1d[index] = starting_sequence[row_index][col_index]
-                index += 1          # count up 1d index
+    @staticmethod
+    def full(rows: int, cols: int, value: T, data_type: type | None=None, order: str='C') -> Array2D:
+        """Builds a rows x cols Array2D with value in every cell using one numpy fill. data_type defaults to type(value).
+            For object data types every cell holds value itself, not a copy.
+
+        Raises:
+            TypeError: if value is not an instance of data_type.
+        """
+        data_type = data_type or type(value)
+        if not isinstance(value, data_type):
+            raise TypeError("Value is not an instance of the specified data type.")
+        Array2D.__check_order(order)
+        elements = np.empty((rows, cols), dtype = NATIVE_DTYPES.get(data_type, object), order = order)
+        elements.fill(value)
+        return Array2D.__from_buffer(elements, data_type)
 
+    @staticmethod
+    def __as_slice(part: int | slice, size: int) -> slice:
+        """Turns one part of arr[r0:r1, c] into a slice, so a block keeps two dimensions even when a part is an index."""
+        if isinstance(part, slice):
+            return part
+        if part >= size or part < -size:
+            raise IndexError("Index out of range.")
+        return slice(part, part + 1 or None)
 
     @staticmethod
-    def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
-        starting_sequence: List[List[T]] = []
+    def empty(rows: int=0, cols: int=0, data_type: type=object, order: str='C') -> Array2D:
+        Array2D.__check_order(order)
+        if data_type in NATIVE_DTYPES:
+            return Array2D.__from_buffer(np.full((rows, cols), data_type(), dtype = NATIVE_DTYPES[data_type], order = order), data_type)
+        elements = np.empty((rows, cols), dtype = object, order = order)
         for row in range(rows):
-            starting_sequence.append([])
             for col in range(cols):
-                starting_sequence[row].append(data_type()) 
-        return Array2D(starting_sequence, data_type)
+                elements[row, col] = data_type()    # a separate default object in every cell
+        return Array2D.__from_buffer(elements, data_type)
 
-    def __getitem__(self, row_index: int) -> Array2D.IRow[T]: 
-        if row_index >= len(self) or row_index < -len(self):
+    def __getitem__(self, index: int | slice | tuple[int | slice, int | slice]) -> Array2D.IRow[T] | Array2D[T] | T:
+        if isinstance(index, slice):        # arr[r0:r1] is a block of whole rows
+            index = (index, slice(None))
+        if isinstance(index, tuple):
+            row_part, col_part = index
+            if isinstance(row_part, slice) or isinstance(col_part, slice):      # arr[r0:r1, c0:c1] shares this array's buffer
+                rows = Array2D.__as_slice(row_part, self.__rows)
+                cols = Array2D.__as_slice(col_part, self.__cols)
+                return Array2D.__from_buffer(self.__elements[rows, cols], self.__data_type, self.__version)
+            item = self.__elements[row_part, col_part]      # arr[r, c] reads the item directly, without making a Row
+            return item.item() if isinstance(item, np.generic) else item
+        if index >= self.__rows or index < -self.__rows:
             raise IndexError("Row index out of range.")
-        return Array2D.Row(row_index, self.__array1d, self.__col_len, self.__data_type)
-    
-    def __iter__(self) -> Iterator[Sequence[T]]: 
+        if index < 0:
+            index += self.__rows
+        row = self.__row_cache[index]
+        if row is None:     # a Row only wraps a view of the buffer, which never moves, so one per row can be reused
+            row = self.__row_cache[index] = Array2D.Row(index, self.__elements[index], self.__cols, self.__data_type, self.__version)
+        return row
+
+    def get(self, row_index: int, col_index: int) -> T:
+        """Returns the item at (row_index, col_index) straight from the buffer, without making a Row or a tuple check."""
+        item = self.__elements[row_index, col_index]
+        return item.item() if isinstance(item, np.generic) else item
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple):
+            raise TypeError("Use arr[r, c] = value or arr[r][c] = value.")
+        if not isinstance(value, self.__data_type):
+            raise TypeError("Item is not an instance of the specified data type.")
+        self.__elements[index] = value
+        self.__version[0] += 1
+
+    def tiles(self, tile_rows: int, tile_cols: int) -> Iterator[tuple[int, int, Array2D[T]]]:
+        """Yields (row, col, block) for every tile_rows x tile_cols block, row of tiles by row of tiles, where row and
+            col are the block's top left corner. Blocks on the bottom and right edges may be smaller. Every block is
+            a view sharing this array's buffer, and pickling a block (to send it to another process) only copies its items.
+        """
+        if tile_rows < 1 or tile_cols < 1:
+            raise ValueError("Tiles must be at least 1 x 1.")
+        for row in range(0, self.__rows, tile_rows):
+            for col in range(0, self.__cols, tile_cols):
+                yield row, col, self[row:row + tile_rows, col:col + tile_cols]
+
+    def transpose(self) -> Array2D[T]:
+        """Returns the cols x rows transpose as a view sharing this array's buffer (no copy). A row-major array's
+            transpose is column-major: its columns are this array's contiguous rows and its rows are strided."""
+        return Array2D.__from_buffer(self.__elements.T, self.__data_type, self.__version)
+
+    def reshape(self, rows: int, cols: int, order: str='C') -> Array2D[T]:
+        """Returns a rows x cols view of the same buffer. The items are read row by row (order='C') or column by
+            column (order='F') and placed back the same way, as numpy does.
+
+        Raises:
+            ValueError: if the sizes differ, or if the buffer is not laid out so the result can be a view (a C order
+                reshape of a column-major array, or of a sub-block, say); reshape never copies.
+        """
+        Array2D.__check_order(order)
+        if rows * cols != self.__elements.size:
+            raise ValueError(f"Can not reshape {self.__rows} x {self.__cols} items into {rows} x {cols}.")
+        reshaped = self.__elements.reshape((rows, cols), order = order)
+        if reshaped.size and not np.may_share_memory(reshaped, self.__elements):
+            raise ValueError("This reshape would need a copy of the items; try the other order or build a new Array2D.")
+        return Array2D.__from_buffer(reshaped, self.__data_type, self.__version)
+
+    def get_order(self) -> str | None:
+        """Returns 'C' if the rows are contiguous in memory, 'F' if the columns are, or None for a strided view."""
+        if self.__elements.flags.c_contiguous:
+            return 'C'
+        if self.__elements.flags.f_contiguous:
+            return 'F'
+        return None
+
+    def row(self, row_index: int) -> NDArray:
+        """Returns a read-only numpy view of a row (no copy)."""
+        view = self.__elements[row_index]
+        view.flags.writeable = False
+        return view
+
+    def col(self, col_index: int) -> NDArray:
+        """Returns a read-only numpy view of a column. It steps through the buffer a row at a time instead of copying."""
+        view = self.__elements[:, col_index]
+        view.flags.writeable = False
+        return view
+
+    def get_data_type(self) -> type:
+        return self.__data_type
+
+    def get_num_cols(self) -> int:
+        return self.__cols
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
         for row_index in range(len(self)):
             yield self[row_index]
-    
+
     def __reversed__(self):
         for row_index in range(len(self) - 1, -1, -1):
             yield self[row_index]
-    
-    def __len__(self): 
-        return len(self.__array1d) // self.__row_len
+
+    def __len__(self):
+        return self.__rows
 
     def __eq__(self, other) -> bool:
-        return str(self) == str(other)
-        # return self.__array1d == other.__array1d
-                                  
-    def __str__(self) -> str: 
+        """Compares the shapes first, then cached hashes when both sides have a current one, then the buffers in one numpy call."""
+        if not isinstance(other, Array2D) or self.__data_type is not other.__data_type:
+            return False
+        if self.__elements.shape != other.__elements.shape:
+            return False
+        if self.__current_hash() is not None and other.__current_hash() is not None and self.__current_hash() != other.__current_hash():
+            return False
+        return bool(np.array_equal(self.__elements, other.__elements))
+
+    def __current_hash(self) -> int | None:
+        if self.__hash is not None and self.__hash[0] == self.__version[0]:
+            return self.__hash[1]
+        return None
+
+    def content_hash(self) -> int:
+        """Returns a 64-bit hash of the shape and items. Typed arrays hash the raw buffer with BLAKE2b and keep the result
+            until the next write, so asking again (or comparing two hashed arrays) is O(1). Object arrays hash their items
+            every time, because an item can change in place without the array knowing.
+
+        Raises:
+            TypeError: if an object array holds unhashable items.
+        """
+        if self.__data_type not in NATIVE_DTYPES:
+            return hash((self.__elements.shape, tuple(self.__elements.ravel().tolist())))
+        cached = self.__current_hash()
+        if cached is not None:
+            return cached
+        items = np.ascontiguousarray(self.__elements)
+        if items.dtype.kind in 'fc':
+            items = items + 0.0         # turns -0.0 into 0.0, which compare equal and so must hash the same
+        digest = hashlib.blake2b(repr((items.shape, items.dtype.str)).encode(), digest_size = 8)
+        digest.update(items.data)
+        value = int.from_bytes(digest.digest(), 'little', signed = True)
+        self.__hash = (self.__version[0], value)
+        return value
+
+    def __hash__(self) -> int:
+        return self.content_hash()
+
+    def to_numpy(self) -> NDArray:
+        """Returns a read-only (rows, cols) numpy view of the items (no copy)."""
+        view = self.__elements.view()
+        view.flags.writeable = False
+        return view
+
+    def __str__(self) -> str:
         return f'[{", ".join(f"{str(row)}" for row in self)}]'
-    
-    def __repr__(self) -> str: 
-        return f'Array2D {len(self)} Rows x {self.__row_len} Columns, items: {str(self)}'
+
+    def __repr__(self) -> str:
+        return f'Array2D {len(self)} Rows x {self.__cols} Columns, items: {str(self)}'
 
 
 if __name__ == '__main__':
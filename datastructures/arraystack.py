@@ -8,14 +8,14 @@ from numpy.typing import NDArray
 from copy import deepcopy
 
 from datastructures.iarray import IArray, T
-from datastructures.array import Array, T
+from datastructures.array import Array, CopyPolicy, T
 from datastructures.istack import IStack
 
 class ArrayStack(IStack[T]):
     ''' ArrayStack class that implements the IStack interface. The ArrayStack is a 
         fixed-size stack that uses an Array to store the items.'''
     
-    def __init__(self, max_size: int = 1, data_type=object) -> None:
+    def __init__(self, max_size: int = 1, data_type=object, copy_policy: CopyPolicy = CopyPolicy.DEEP) -> None:
         ''' Constructor to initialize the stack 
 
             Examples:
@@ -30,12 +30,14 @@ class ArrayStack(IStack[T]):
             Arguments: 
                 max_size: int -- The maximum size of the stack. 
                 data_type: type -- The data type of the stack.       
+                copy_policy: CopyPolicy -- Whether pushed items are stored as references, shallow copies or deep copies (default).
         '''
-        self.array = Array.empty(elements = max_size, data_type = data_type)
+        self.array = Array.empty(elements = max_size, data_type = data_type, copy_policy = copy_policy)
         self.max_size = max_size
         self.data_type = data_type
         self.top_item_index = -1    # starting at -1 so when you add the first item its index is 0
         self.array.set_element_count(0)     # because otherwise Array thinks the length is max_size
+        self.array.reserve(max_size)        # the stack never holds more than max_size, so popping never needs to shrink the array
 
     def push(self, item: T) -> None:
         ''' Pushes an item onto the stack.
@@ -276,10 +278,7 @@ class ArrayStack(IStack[T]):
             Returns:
                 bool -- True if the item is in the stack, False otherwise.
         '''
-        for i in range(self.top_item_index + 1):
-            if self.array[i] == item:
-                return True
-        return False
+        return item in self.array     # the array only holds the stack's items, so one vectorized search covers them
 
     def __str__(self) -> str:
         ''' Returns a string representation of the stack.
@@ -295,7 +294,7 @@ class ArrayStack(IStack[T]):
             Returns:
                 str -- A string representation of the stack.
         '''
-        return str([self.array[i] for i in range(self.top_item_index + 1)])
+        return str(list(self.array))
     
     def __repr__(self) -> str:
         ''' Returns a string representation of the stack.
@@ -0,0 +1,130 @@
+# datastructures.arraystream.ArrayStream
+
+""" This module defines an ArrayStream class, the lazy pipeline returned by Array.stream().
+    Stages (map, filter, take, skip, chunk) are only recorded until collect(), to_array() or iteration runs them
+    in a single pass, so no Array is built between stages.
+"""
+
+from __future__ import annotations
+from itertools import chain, islice
+import os
+from typing import Any, Callable, Generic, Iterator
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.iarray import T
+from datastructures.array import Array
+
+
+class ArrayStream(Generic[T]):
+    """ Lazy pipeline over the items of an Array. Every stage returns a new stream and nothing runs until the stream
+        is consumed. While the items are still a numpy array, take and skip are slices and, for typed arrays, map and
+        filter stages given a numpy ufunc (or marked vectorized=True) run as whole-array numpy operations. The first
+        stage that can not run in numpy switches the rest of the pipeline to Python generators, which are fused into
+        one pass that reads the source a chunk at a time.
+    """
+
+    def __init__(self, source: Array[T], stages: tuple[tuple[Any, ...], ...]=()) -> None:
+        self.__source = source
+        self.__stages = stages
+
+    def __then(self, *stage: Any) -> ArrayStream:
+        return ArrayStream(self.__source, self.__stages + (stage,))
+
+    def map(self, fn: Callable[[Any], Any], vectorized: bool=False) -> ArrayStream:
+        """Applies fn to every item. Pass vectorized=True when fn also works on a whole numpy array (ufuncs are detected)."""
+        return self.__then('map', fn, vectorized or isinstance(fn, np.ufunc))
+
+    def filter(self, predicate: Callable[[Any], bool], vectorized: bool=False) -> ArrayStream:
+        """Keeps the items for which predicate is true. vectorized=True means predicate returns a mask for a whole numpy array."""
+        return self.__then('filter', predicate, vectorized or isinstance(predicate, np.ufunc))
+
+    def take(self, count: int) -> ArrayStream:
+        """Keeps at most the first count items. Later stages never see, and earlier Python stages never compute, the rest."""
+        if count < 0:
+            raise ValueError("Count must be 0 or above.")
+        return self.__then('take', count)
+
+    def skip(self, count: int) -> ArrayStream:
+        """Drops the first count items."""
+        if count < 0:
+            raise ValueError("Count must be 0 or above.")
+        return self.__then('skip', count)
+
+    def chunk(self, size: int) -> ArrayStream:
+        """Groups the items into lists of size items (the last list may be shorter)."""
+        if size < 1:
+            raise ValueError("Chunk size must be 1 or above.")
+        return self.__then('chunk', size)
+
+    def __run(self) -> NDArray | Iterator[Any]:
+        """Runs the stages and returns a numpy array if every stage ran in numpy, otherwise a fused generator."""
+        items: NDArray | Iterator[Any] = self.__source.get_range()
+        typed = self.__source.is_typed
+        for kind, *arguments in self.__stages:
+            if isinstance(items, np.ndarray):
+                if kind == 'take':
+                    items = items[:arguments[0]]
+                    continue
+                if kind == 'skip':
+                    items = items[arguments[0]:]
+                    continue
+                if typed and kind == 'map' and arguments[1]:
+                    items = np.asarray(arguments[0](items))
+                    continue
+                if typed and kind == 'filter' and arguments[1]:
+                    items = items[np.asarray(arguments[0](items), dtype = bool)]
+                    continue
+                items = ArrayStream.__stream(items)
+            if kind == 'map':
+                items = map(arguments[0], items)
+            elif kind == 'filter':
+                items = filter(arguments[0], items)
+            elif kind == 'take':
+                items = islice(items, arguments[0])
+            elif kind == 'skip':
+                items = islice(items, arguments[0], None)
+            elif kind == 'chunk':
+                items = ArrayStream.__group(items, arguments[0])
+        return items
+
+    @staticmethod
+    def __stream(items: NDArray, block: int=1 << 12) -> Iterator[Any]:
+        """Yields native Python items from a numpy array, converting one block at a time."""
+        return chain.from_iterable(items[start:start + block].tolist() for start in range(0, len(items), block))
+
+    @staticmethod
+    def __group(items: Iterator[Any], size: int) -> Iterator[list[Any]]:
+        while group := list(islice(items, size)):
+            yield group
+
+    def __iter__(self) -> Iterator[Any]:
+        items = self.__run()
+        return ArrayStream.__stream(items) if isinstance(items, np.ndarray) else items
+
+    def collect(self) -> list[Any]:
+        """Runs the pipeline and returns the results as a list."""
+        items = self.__run()
+        return items.tolist() if isinstance(items, np.ndarray) else list(items)
+
+    def to_array(self, data_type: type | None=None) -> Array:
+        """Runs the pipeline and returns the results as a new Array. Without a data_type, a pipeline with no map or
+            chunk stage keeps the source's data type; otherwise the results' dtype (or their common type) is used."""
+        items = self.__run()
+        if data_type is None and all(stage[0] not in ('map', 'chunk') for stage in self.__stages):
+            data_type = self.__source.get_data_type()
+        if isinstance(items, np.ndarray):
+            return Array.from_numpy(items, data_type = data_type, copy_policy = self.__source.get_copy_policy())
+        items = list(items)
+        if data_type is None:
+            kinds = {type(item) for item in items}
+            data_type = kinds.pop() if len(kinds) == 1 else object
+        return Array.from_iterable(items, data_type = data_type, copy_policy = self.__source.get_copy_policy())
+
+    def __repr__(self) -> str:
+        return f'ArrayStream over {len(self.__source)} items, stages: {[stage[0] for stage in self.__stages]}'
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -7,7 +7,7 @@ from numpy.typing import NDArray
 from copy import deepcopy
 
 from datastructures.iarray import IArray, T
-from datastructures.array import Array
+from datastructures.array import Array, CopyPolicy
 from datastructures.iqueue import IQueue, T
 
 class CircularQueue(IQueue[T]):
@@ -18,7 +18,7 @@ class CircularQueue(IQueue[T]):
         and rear pointers are equal. This implementation uses a fixed-size array.
     """
 
-    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+    def __init__(self, maxsize: int = 0, data_type=object, copy_policy: CopyPolicy = CopyPolicy.REFERENCE) -> None:
         ''' Initializes the CircularQueue object with a maxsize and data_type.
         
             Examples:
@@ -37,8 +37,9 @@ class CircularQueue(IQueue[T]):
             Arguments:
                 maxsize: The maximum size of the queue
                 data_type: The type of the elements in the queue
+                copy_policy: Whether enqueued items are stored as references (default), shallow copies or deep copies
         '''
-        self.array = Array.empty(elements = maxsize, data_type = data_type)
+        self.array = Array.empty(elements = maxsize, data_type = data_type, copy_policy = copy_policy)
         self.max_size = maxsize
         self.data_type = data_type
         self.size = 0
@@ -76,7 +77,7 @@ class CircularQueue(IQueue[T]):
         if self.size == self.maxsize:
             raise IndexError('Queue is full')
 
-        self.array[self.r] = item
+        self.array[self.r] = self.array.copy_item(item)
         self.r = (self.r + 1) % self.maxsize
         self.size += 1
 
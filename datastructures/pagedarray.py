@@ -0,0 +1,252 @@
+# datastructures.pagedarray.PagedArray
+
+""" This module defines a PagedArray class, a one-dimensional array that stores its items in fixed-size numpy chunks
+    listed in a chunk directory instead of in one big numpy array.
+    See the stipulations in iarray.py for more information on the methods and their expected behavior.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+from copy import copy, deepcopy
+from itertools import islice
+import os
+from typing import Any, Iterator, overload
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.iarray import IArray, T
+from datastructures.array import Array, CopyPolicy, EXTEND_CHUNK_SIZE, NATIVE_DTYPES
+
+
+class PagedArray(IArray[T]):
+    """ Array that keeps its items in fixed-size numpy chunks (pages) listed in a chunk directory (a Python list).
+        Growing at either end only allocates one new chunk, so huge arrays never copy everything into a bigger buffer
+        and peak memory stays at the size of the items plus one chunk. Random access is still O(1): the chunk size
+        is a power of two, so an index splits into a chunk number and an offset with a shift and a mask.
+    """
+
+    def __init__(self, starting_sequence: Sequence[T]=(), data_type: type=object, copy_policy: CopyPolicy=CopyPolicy.DEEP,
+                 chunk_size: int=1 << 16) -> None:
+        ## ERRORS
+        if not isinstance(starting_sequence, Sequence):
+            raise ValueError("Starting sequence is not a valid sequence type.")
+        if not isinstance(data_type, type):
+            raise ValueError("Data type is not a valid type.")
+        if chunk_size < 1 or chunk_size & (chunk_size - 1) != 0:
+            raise ValueError("Chunk size must be a power of two.")
+
+        ## INITIALIZE ATTRIBUTES
+        self.__chunks: list[NDArray] = []      # chunk directory
+        self.__chunk_size = chunk_size
+        self.__shift = chunk_size.bit_length() - 1
+        self.__mask = chunk_size - 1
+        self.__head = 0                         # offset of the first item in the first chunk
+        self.__element_count = 0
+        self.__data_type = data_type
+        self.__copy_policy = copy_policy
+        self.__dtype = NATIVE_DTYPES.get(data_type, object)
+
+        self.extend(starting_sequence)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Appends every item of values, checking types and copying a block at a time the same way Array.extend does."""
+        iterator = iter(values)
+        while block := list(islice(iterator, EXTEND_CHUNK_SIZE)):
+            checked = Array(block, data_type = self.__data_type, copy_policy = self.__copy_policy).get_range()
+            written = 0
+            while written < len(checked):
+                end = self.__head + self.__element_count
+                if end == len(self.__chunks) * self.__chunk_size:
+                    self.__chunks.append(self.__new_chunk())
+                offset = end & self.__mask
+                count = min(self.__chunk_size - offset, len(checked) - written)
+                self.__chunks[end >> self.__shift][offset:offset + count] = checked[written:written + count]
+                written += count
+                self.__element_count += count
+
+    def __new_chunk(self) -> NDArray:
+        return np.empty(self.__chunk_size, dtype = self.__dtype)
+
+    def __locate(self, index: int) -> tuple[NDArray, int]:
+        """Maps a logical index (negative indexes wrap around) to its chunk and the offset inside that chunk."""
+        if index < -self.__element_count or index >= self.__element_count:
+            raise IndexError("Index out of range.")
+        if index < 0:
+            index += self.__element_count
+        position = self.__head + index
+        return self.__chunks[position >> self.__shift], position & self.__mask
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, int):
+            chunk, offset = self.__locate(index)
+            item = chunk[offset]
+            return item.item() if isinstance(item, np.generic) else item
+        elif isinstance(index, slice):      # slices are copied out into a regular Array
+            positions = range(self.__element_count)[index]
+            if len(positions) == 0:
+                return Array([], data_type = self.__data_type, copy_policy = self.__copy_policy)
+            low, high = min(positions[0], positions[-1]), max(positions[0], positions[-1])
+            covered = self.get_range(low, high + 1)
+            return Array.from_numpy(covered[positions.start - low::positions.step], data_type = self.__data_type, copy_policy = self.__copy_policy)
+        else:
+            raise TypeError("Argument must be an index or a slice.")
+
+    def __setitem__(self, index: int, item: T) -> None:
+        if not isinstance(item, self.__data_type):
+            raise TypeError("Item is not an instance of the specified data type.")
+        chunk, offset = self.__locate(index)
+        chunk[offset] = item
+
+    def get_range(self, start: int=0, stop: int | None=None) -> NDArray:
+        """Returns the items from start up to (not including) stop as a numpy array: a read-only view when they sit
+            in one chunk, otherwise a new array joining the pieces."""
+        start, stop, _ = slice(start, stop).indices(self.__element_count)
+        pieces = list(self.__pieces(start, max(start, stop)))
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces) if pieces else np.empty(0, dtype = self.__dtype)
+
+    def __pieces(self, start: int, stop: int) -> Iterator[NDArray]:
+        """Yields read-only views of the parts of each chunk that hold the items from start up to stop."""
+        position, end = self.__head + start, self.__head + stop
+        while position < end:
+            offset = position & self.__mask
+            count = min(self.__chunk_size - offset, end - position)
+            piece = self.__chunks[position >> self.__shift][offset:offset + count]
+            piece.flags.writeable = False
+            yield piece
+            position += count
+
+    def iter_chunks(self) -> Iterator[NDArray]:
+        """Streams the items chunk by chunk as read-only numpy views, without copying."""
+        return self.__pieces(0, self.__element_count)
+
+    def get_chunk_count(self) -> int:
+        return len(self.__chunks)
+
+    def get_chunk_size(self) -> int:
+        return self.__chunk_size
+
+    def append(self, data: T) -> None:
+        if not isinstance(data, self.__data_type):
+            raise TypeError("Item is not an instance of the array's specified data type.")
+        end = self.__head + self.__element_count
+        if end == len(self.__chunks) * self.__chunk_size:     # last chunk is full
+            self.__chunks.append(self.__new_chunk())
+        self.__chunks[end >> self.__shift][end & self.__mask] = self.__copy_item(data)
+        self.__element_count += 1
+
+    def append_front(self, data: T) -> None:
+        if not isinstance(data, self.__data_type):
+            raise TypeError("Item is not an instance of the array's specified data type.")
+        if self.__head == 0:        # first chunk is full at the front
+            self.__chunks.insert(0, self.__new_chunk())
+            self.__head = self.__chunk_size
+        self.__head -= 1
+        self.__chunks[0][self.__head] = self.__copy_item(data)
+        self.__element_count += 1
+
+    def __copy_item(self, item: T) -> T:
+        if self.__copy_policy is CopyPolicy.REFERENCE or self.__dtype is not object:
+            return item
+        if self.__copy_policy is CopyPolicy.SHALLOW:
+            return copy(item)
+        return deepcopy(item)
+
+    def pop(self) -> T:
+        chunk, offset = self.__locate(-1)
+        popped = chunk[offset]
+        popped = popped.item() if isinstance(popped, np.generic) else popped
+        if self.__dtype is object:
+            chunk[offset] = None    # drop the array's reference to the item
+        self.__element_count -= 1
+        self.__release_chunks()
+        return popped
+
+    def pop_front(self) -> T:
+        chunk, offset = self.__locate(0)
+        popped = chunk[offset]
+        popped = popped.item() if isinstance(popped, np.generic) else popped
+        if self.__dtype is object:
+            chunk[offset] = None
+        self.__head += 1
+        self.__element_count -= 1
+        self.__release_chunks()
+        return popped
+
+    def __release_chunks(self) -> None:
+        """Drops chunks that no longer hold any items from either end of the chunk directory."""
+        if self.__element_count == 0:
+            self.__chunks.clear()
+            self.__head = 0
+            return
+        if self.__head >= self.__chunk_size:
+            del self.__chunks[0]
+            self.__head -= self.__chunk_size
+        while (len(self.__chunks) - 1) * self.__chunk_size >= self.__head + self.__element_count:
+            self.__chunks.pop()
+
+    def __len__(self) -> int:
+        return self.__element_count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (PagedArray, Array)) or len(other) != len(self):
+            return False
+        for start in range(0, self.__element_count, self.__chunk_size):     # compare a chunk's worth at a time
+            stop = start + self.__chunk_size
+            if not np.array_equal(self.get_range(start, stop), other.get_range(start, stop)):
+                return False
+        return True
+
+    def __iter__(self) -> Iterator[T]:
+        for piece in self.iter_chunks():
+            yield from piece.tolist()
+
+    def __reversed__(self) -> Iterator[T]:
+        for piece in reversed(list(self.iter_chunks())):
+            yield from piece[::-1].tolist()
+
+    def __delitem__(self, index: int) -> None:
+        chunk, offset = self.__locate(index)
+        number = (self.__head + (index % self.__element_count)) >> self.__shift
+        while True:     # slide every later item back one slot, one block move per chunk
+            chunk[offset:-1] = chunk[offset + 1:]
+            number += 1
+            if number == len(self.__chunks):
+                break
+            chunk[-1] = self.__chunks[number][0]
+            chunk, offset = self.__chunks[number], 0
+        self.pop()      # the last item now appears twice
+
+    def __contains__(self, item: Any) -> bool:
+        for piece in self.iter_chunks():
+            if self.__dtype is object:
+                if any(element is item or element == item for element in piece):
+                    return True
+            elif isinstance(item, (bool, int, float, complex, np.number, np.bool_)) and (piece == item).any():
+                return True
+        return False
+
+    def clear(self) -> None:
+        self.__chunks.clear()
+        self.__head = 0
+        self.__element_count = 0
+
+    def __array__(self, dtype: Any=None, copy: bool | None=None) -> NDArray:
+        items = self.get_range()
+        return items.astype(dtype) if dtype is not None else items
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f'PagedArray {self.__str__()}, Logical: {self.__element_count}, Chunks: {len(self.__chunks)} x {self.__chunk_size}, type: {self.__data_type}'
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,71 @@
+# datastructures.parallel
+
+""" This module holds the process pool plumbing behind Array.parallel_map and Array.parallel_reduce.
+    The worker functions live at module level so the pool can pickle them. Typed arrays are copied once into a
+    multiprocessing.shared_memory block that every worker reads in place; object arrays send each worker a pickled
+    list holding its chunk.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from multiprocessing import shared_memory
+import os
+from typing import Any, Callable
+import numpy as np
+from numpy.typing import NDArray
+
+
+def chunk_bounds(length: int, workers: int, chunk_size: int | None) -> list[tuple[int, int]]:
+    """Splits range(length) into (start, stop) pairs. Without a chunk_size every worker gets about four chunks."""
+    if chunk_size is None:
+        chunk_size = max(1, -(-length // (workers * 4)))
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def map_chunk(fn: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    return [fn(item) for item in items]
+
+
+def reduce_chunk(fn: Callable[[Any, Any], Any], items: list[Any]) -> Any:
+    return reduce(fn, items)
+
+
+def shared_chunk(task: Callable[[Callable, list[Any]], Any], fn: Callable, name: str, dtype: str, length: int,
+                 start: int, stop: int) -> Any:
+    """Attaches to the shared memory block holding a typed array and runs task on the items from start up to stop."""
+    block = shared_memory.SharedMemory(name = name)
+    try:
+        shared = np.ndarray((length,), dtype = np.dtype(dtype), buffer = block.buf)
+        items = shared[start:stop].tolist()
+        del shared      # the block can only close once no numpy array points into it
+    finally:
+        block.close()
+    return task(fn, items)
+
+
+def run_chunks(task: Callable[[Callable, list[Any]], Any], fn: Callable, items: NDArray, workers: int | None,
+               chunk_size: int | None) -> list[Any]:
+    """Runs task(fn, chunk) for every chunk of items in a process pool and returns the results in chunk order."""
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(len(items), workers, chunk_size)
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        if items.dtype == object:
+            futures = [pool.submit(task, fn, items[start:stop].tolist()) for start, stop in bounds]
+            return [future.result() for future in futures]
+        block = shared_memory.SharedMemory(create = True, size = max(1, items.nbytes))
+        try:
+            np.ndarray(items.shape, dtype = items.dtype, buffer = block.buf)[:] = items
+            futures = [pool.submit(shared_chunk, task, fn, block.name, items.dtype.str, len(items), start, stop)
+                       for start, stop in bounds]
+            return [future.result() for future in futures]
+        finally:
+            block.close()
+            block.unlink()
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
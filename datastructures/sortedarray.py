@@ -0,0 +1,75 @@
+# datastructures.sortedarray.SortedArray
+
+""" This module defines a SortedArray class, an Array that always keeps its items in ascending order
+    so that it can be searched with binary search.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+import os
+from typing import Any
+import numpy as np
+
+from datastructures.array import Array, CopyPolicy, T
+
+
+class SortedArray(Array[T]):
+    """ An Array whose items are always in ascending order. Items are added with append (or append_front, or extend),
+        which put them where they belong, so items can not be assigned to a chosen index.
+        Membership tests and bisect_left/bisect_right are O(log n) binary searches.
+    """
+
+    def __init__(self, starting_sequence: Sequence[T]=(), data_type: type=object, copy_policy: CopyPolicy=CopyPolicy.DEEP) -> None:
+        super().__init__(starting_sequence, data_type = data_type, copy_policy = copy_policy)
+
+    def bisect_left(self, value: Any) -> int:
+        """Returns the index where value would be inserted to stay sorted, before any items equal to it."""
+        return int(np.searchsorted(self.get_range(), value, side = 'left'))
+
+    def bisect_right(self, value: Any) -> int:
+        """Returns the index where value would be inserted to stay sorted, after any items equal to it."""
+        return int(np.searchsorted(self.get_range(), value, side = 'right'))
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            index = self.bisect_left(item)
+        except TypeError:       # item can not be ordered against the items, so it can not be one of them
+            return False
+        return index < len(self) and self[index] == item
+
+    def append(self, data: T) -> None:
+        """Adds data in sorted position, after any items equal to it."""
+        if not isinstance(data, self.get_data_type()):
+            raise TypeError("Item is not an instance of the array's specified data type.")
+        super().insert(self.bisect_right(data), data)
+
+    def append_front(self, data: T) -> None:
+        """Same as append; a SortedArray decides where its items go."""
+        self.append(data)
+
+    def extend(self, values: Iterable[T]) -> None:
+        super().extend(values)
+        super().sort()
+
+    def insert(self, index: int, value: T) -> None:
+        raise TypeError("SortedArray keeps its own order; add items with append instead of inserting at an index.")
+
+    def insert_many(self, index: int, values: Iterable[T]) -> None:
+        raise TypeError("SortedArray keeps its own order; add items with extend instead of inserting at an index.")
+
+    def __setitem__(self, index: int, item: T) -> None:
+        raise TypeError("SortedArray keeps its own order; add items with append instead of assigning to an index.")
+
+    def set_range(self, start: int, values: Sequence[T]) -> None:
+        raise TypeError("SortedArray keeps its own order; add items with extend instead of assigning to a range.")
+
+    def sort(self, key: Any=None, reverse: bool=False) -> None:
+        raise TypeError("SortedArray is always sorted in ascending order.")
+
+    def __repr__(self) -> str:
+        return 'Sorted' + super().__repr__()
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,262 @@
+# datastructures.sparsearray2d.SparseArray2D
+
+""" This module defines a SparseArray2D class, a two-dimensional array that stores only the cells that differ from a
+    default value, in a dictionary or, once compacted, in CSR arrays.
+    See the stipulations in iarray2d.py for more information on the methods and their expected behavior.
+"""
+
+from __future__ import annotations
+from enum import Enum
+import os
+import sys
+from typing import Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import NATIVE_DTYPES
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D, T
+
+
+## Types whose instances can not be changed in place. The default is one object that every cell that is not stored
+## hands out, so it has to be one of these: changing a shared mutable default would change every unset cell at once.
+IMMUTABLE_DEFAULTS = (type(None), bool, int, float, complex, str, bytes, tuple, frozenset, Enum)
+
+class SparseArray2D(IArray2D[T]):
+    """ Two-dimensional array that only stores the cells that differ from a default value, so memory grows with the
+        number of entries instead of rows x cols. Writes go to a dictionary of rows, each a dictionary of columns, so
+        reaching one row costs as much as the entries in that row. compact() packs the entries into CSR arrays
+        (row pointers, column indexes, values) for read-heavy phases: a read then binary searches one row's column
+        indexes, and the next write unpacks the entries back into dictionaries. The default must be immutable
+        (see IMMUTABLE_DEFAULTS); use data_type=object with a default of None for cells that hold mutable objects.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: SparseArray2D, num_columns: int) -> None:
+            self.__index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            return self.__array.get(self.__index, column_index)
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            self.__array[self.__index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            """Yields every column of the row, default cells included. Use items() to skip the default cells."""
+            values = dict(self.items())
+            default = self.__array.get_default()
+            for column_index in range(self.__num_columns):
+                yield values.get(column_index, default)
+
+        def __reversed__(self) -> Iterator[T]:
+            return reversed(list(self))
+
+        def __len__(self) -> int:
+            return self.__num_columns
+
+        def items(self) -> Iterator[tuple[int, T]]:
+            """Yields (col, value) for the row's non-default cells, left to right."""
+            for (_, column_index), value in self.__array.items(self.__index):
+                yield column_index, value
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.__index}: {str(self)}'
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=((),), data_type=object, default: T | None=None) -> None:
+        ## CHECK FOR ERRORS (one pass over the rows)
+        if not isinstance(starting_sequence, Sequence) or isinstance(starting_sequence, str):
+            raise ValueError("Starting sequence is not a valid sequence.")
+
+        for row in starting_sequence:
+            if not isinstance(row, Sequence):
+                raise ValueError("Starting sequence must be a sequence of sequences.")
+            if len(row) != len(starting_sequence[0]):
+                raise ValueError("All inner sequences must be the same size.")
+            if not all(isinstance(item, data_type) for item in row):
+                raise ValueError("All items must be instances of the specified data type.")
+
+        ## INITIALIZE ATTRIBUTES
+        self.__data_type = data_type
+        if default is None and data_type is not object:
+            default = data_type()       # 0, 0.0, False, '' ... (an object array keeps None as its default)
+        self.__default = default
+        if not isinstance(self.__default, data_type):
+            raise ValueError("Default is not an instance of the specified data type.")
+        if not isinstance(self.__default, IMMUTABLE_DEFAULTS):
+            raise ValueError("Default must be immutable, since every cell that is not stored shares it. Try data_type=object with default=None.")
+        self.__rows = len(starting_sequence)
+        self.__cols = len(starting_sequence[0]) if self.__rows > 0 else 0
+        self.__cells: dict[int, dict[int, T]] | None = {}      # row -> {col -> value} for rows with entries, None while compacted
+        self.__csr: tuple[NDArray, NDArray, NDArray] | None = None     # (row pointers, column indexes, values) while compacted
+
+        ## KEEP ONLY THE NON-DEFAULT ITEMS
+        for row_index, row in enumerate(starting_sequence):
+            entries = {col_index: item for col_index, item in enumerate(row) if item != self.__default}
+            if entries:
+                self.__cells[row_index] = entries
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=object, default: T | None=None) -> SparseArray2D:
+        """Creates a rows x cols array of default cells without storing any of them."""
+        array = SparseArray2D((), data_type = data_type, default = default)
+        array.__rows, array.__cols = rows, cols
+        return array
+
+    @staticmethod
+    def from_array2d(array: Array2D[T], default: T | None=None) -> SparseArray2D:
+        """Builds a SparseArray2D holding the cells of array that differ from default, found with one numpy comparison."""
+        sparse = SparseArray2D.empty(len(array), array.get_num_cols(), array.get_data_type(), default)
+        elements = array.to_numpy()
+        for row_index, col_index in zip(*np.nonzero(elements != sparse.__default)):
+            sparse.__cells.setdefault(int(row_index), {})[int(col_index)] = array.get(int(row_index), int(col_index))
+        return sparse
+
+    def to_array2d(self) -> Array2D[T]:
+        """Returns a dense Array2D with the same items."""
+        dense = Array2D.full(self.__rows, self.__cols, self.__default, self.__data_type)
+        for (row_index, col_index), value in self.items():
+            dense[row_index, col_index] = value
+        return dense
+
+    def __check_bounds(self, row_index: int, col_index: int) -> tuple[int, int]:
+        if row_index >= self.__rows or row_index < -self.__rows or col_index >= self.__cols or col_index < -self.__cols:
+            raise IndexError("Index out of range.")
+        return row_index % self.__rows, col_index % self.__cols
+
+    def get(self, row_index: int, col_index: int) -> T:
+        """Returns the item at (row_index, col_index): the stored value, or the default for a cell that is not stored."""
+        row_index, col_index = self.__check_bounds(row_index, col_index)
+        if self.__cells is not None:
+            entries = self.__cells.get(row_index)
+            return self.__default if entries is None else entries.get(col_index, self.__default)
+        pointers, columns, values = self.__csr
+        start, stop = pointers[row_index], pointers[row_index + 1]
+        position = start + np.searchsorted(columns[start:stop], col_index)
+        if position < stop and columns[position] == col_index:
+            value = values[position]
+            return value.item() if isinstance(value, np.generic) else value
+        return self.__default
+
+    def __getitem__(self, index: int | tuple[int, int]) -> SparseArray2D.Row[T] | T:
+        if isinstance(index, tuple):
+            return self.get(*index)
+        if index >= self.__rows or index < -self.__rows:
+            raise IndexError("Row index out of range.")
+        return SparseArray2D.Row(index % self.__rows, self, self.__cols)
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(value, self.__data_type):
+            raise TypeError("Item is not an instance of the specified data type.")
+        row_index, col_index = self.__check_bounds(*index)
+        cells = self.__expand()
+        if value != self.__default:
+            cells.setdefault(row_index, {})[col_index] = value
+        elif row_index in cells:            # a default cell is never stored, and neither is a row without entries
+            cells[row_index].pop(col_index, None)
+            if not cells[row_index]:
+                del cells[row_index]
+
+    def compact(self) -> None:
+        """Packs the entries into CSR arrays, sorted by row then column, for a phase of mostly reads."""
+        if self.__cells is None:
+            return
+        count = self.get_entry_count()
+        columns = np.empty(count, dtype = np.int64)
+        values = np.empty(count, dtype = NATIVE_DTYPES.get(self.__data_type, object))
+        pointers = np.zeros(self.__rows + 1, dtype = np.int64)
+        position = 0
+        for (row_index, col_index), value in self.items():
+            columns[position] = col_index
+            values[position] = value
+            pointers[row_index + 1] += 1
+            position += 1
+        np.cumsum(pointers, out = pointers)
+        self.__csr = (pointers, columns, values)
+        self.__cells = None
+
+    def __expand(self) -> dict[int, dict[int, T]]:
+        """Unpacks CSR arrays back into the dictionaries (if compacted) and returns the dictionary of rows."""
+        if self.__cells is None:
+            pointers, columns, values = self.__csr
+            self.__cells = {}
+            for row_index in np.flatnonzero(np.diff(pointers)).tolist():       # only the rows with entries
+                start, stop = pointers[row_index], pointers[row_index + 1]
+                self.__cells[row_index] = dict(zip(columns[start:stop].tolist(), values[start:stop].tolist()))
+            self.__csr = None
+        return self.__cells
+
+    @property
+    def is_compacted(self) -> bool:
+        return self.__cells is None
+
+    def items(self, row_index: int | None=None) -> Iterator[tuple[tuple[int, int], T]]:
+        """Yields ((row, col), value) for every non-default cell in row-major order, or only those of one row."""
+        if self.__cells is not None:
+            rows = sorted(self.__cells) if row_index is None else [row_index] if row_index in self.__cells else []
+            for current in rows:
+                entries = self.__cells[current]
+                for col_index in sorted(entries):
+                    yield (current, col_index), entries[col_index]
+            return
+        pointers, columns, values = self.__csr
+        first, last = (0, self.__rows) if row_index is None else (row_index, row_index + 1)
+        for current in range(first, last):
+            start, stop = pointers[current], pointers[current + 1]
+            for col_index, value in zip(columns[start:stop].tolist(), values[start:stop].tolist()):
+                yield (current, col_index), value
+
+    def get_entry_count(self) -> int:
+        """Returns the number of stored (non-default) cells."""
+        if self.__cells is not None:
+            return sum(len(entries) for entries in self.__cells.values())
+        return len(self.__csr[1])
+
+    def get_default(self) -> T:
+        return self.__default
+
+    def get_data_type(self) -> type:
+        return self.__data_type
+
+    def get_num_cols(self) -> int:
+        return self.__cols
+
+    def memory_usage(self) -> int:
+        """Returns the number of bytes held for the entries: the dictionaries of rows and columns, or the CSR arrays.
+            It grows with the number of entries, not with rows x cols (except for the CSR row pointers)."""
+        if self.__cells is not None:
+            return sys.getsizeof(self.__cells) + sum(sys.getsizeof(entries) for entries in self.__cells.values())
+        return sum(part.nbytes for part in self.__csr)
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__rows):
+            yield self[row_index]
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__rows - 1, -1, -1):
+            yield self[row_index]
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SparseArray2D) or self.__data_type is not other.__data_type:
+            return False
+        if (self.__rows, self.__cols, self.__default) != (other.__rows, other.__cols, other.__default):
+            return False
+        return self.get_entry_count() == other.get_entry_count() and all(value == other.get(*key) for key, value in self.items())
+
+    def __str__(self) -> str:
+        return f'[{", ".join(str(row) for row in self)}]'
+
+    def __repr__(self) -> str:
+        return f'SparseArray2D {self.__rows} Rows x {self.__cols} Columns, entries: {self.get_entry_count()}, default: {self.__default!r}'
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -13,6 +13,7 @@ from projects.project2.cell import Cell
 from copy import deepcopy
 import random
 import time
+import numpy as np
 
 
 class Grid(Array2D):
@@ -63,8 +64,20 @@ class Grid(Array2D):
         print(str(self))
 
 
+    def alive_mask(self) -> np.ndarray:
+        """ Returns a (rows, cols) numpy array of bools, True where the cell is alive. """
+        return np.vectorize(lambda cell: cell.is_alive, otypes = [bool])(self.grid.to_numpy())
+
+
     def __eq__(self, other: Grid) -> bool:
-        return str(self) == str(other)
+        """ Grids are equal when the same cells are alive. The shapes are compared before any cell is looked at. """
+        if not isinstance(other, Grid) or (self.rows, self.cols) != (other.rows, other.cols):
+            return False
+        return bool(np.array_equal(self.alive_mask(), other.alive_mask()))
+
+
+    def __hash__(self) -> int:
+        return hash((self.rows, self.cols, np.packbits(self.alive_mask()).tobytes()))
 
 
     def count_neighbors(self) -> None:
@@ -84,32 +97,32 @@ class Grid(Array2D):
 
                 ## CHECK TOP NEIGHBORS
                 if cell.row != 0:   # not touching top
-                    if self.grid[cell.row - 1][cell.col].is_alive:    # UC
+                    if self.grid.get(cell.row - 1, cell.col).is_alive:    # UC
                         cell.neighbors += 1
                     if cell.col != 0:   # not touching L side
-                        if self.grid[cell.row - 1][cell.col - 1].is_alive:  # UL
+                        if self.grid.get(cell.row - 1, cell.col - 1).is_alive:  # UL
                             cell.neighbors += 1
                     if cell.col != self.cols - 1:   # not touching R side
-                        if self.grid[cell.row - 1][cell.col + 1].is_alive:  # UR
+                        if self.grid.get(cell.row - 1, cell.col + 1).is_alive:  # UR
                             cell.neighbors += 1
                 
                 ## CHECK SIDE NEIGHBORS
                 if cell.col != 0:   # not touching L side
-                    if self.grid[cell.row][cell.col - 1].is_alive:  # L
+                    if self.grid.get(cell.row, cell.col - 1).is_alive:  # L
                         cell.neighbors += 1
                 if cell.col != self.cols - 1:   # not touching R side
-                    if self.grid[cell.row][cell.col + 1].is_alive:  # R
+                    if self.grid.get(cell.row, cell.col + 1).is_alive:  # R
                         cell.neighbors += 1
 
                 ## CHECK BOTTOM NEIGHBORS
                 if cell.row != self.rows - 1:   # not touching bottom
-                    if self.grid[cell.row + 1][cell.col].is_alive:    # DC
+                    if self.grid.get(cell.row + 1, cell.col).is_alive:    # DC
                         cell.neighbors += 1
                     if cell.col != 0:   # not touching L side
-                        if self.grid[cell.row + 1][cell.col - 1].is_alive:  # DL
+                        if self.grid.get(cell.row + 1, cell.col - 1).is_alive:  # DL
                             cell.neighbors += 1
                     if cell.col != self.cols - 1:   # not touching R side
-                        if self.grid[cell.row + 1][cell.col + 1].is_alive:  # DR
+                        if self.grid.get(cell.row + 1, cell.col + 1).is_alive:  # DR
                             cell.neighbors += 1
 
 
@@ -117,10 +130,10 @@ class Grid(Array2D):
         next_gen = Grid(self.cols, self.rows)
         for row_idx in range(self.rows):
                 for col_idx in range(self.cols):     # for each cell:
-                    if self.grid[row_idx][col_idx].alive_next_gen():
-                        next_gen.grid[row_idx][col_idx].is_alive = True
+                    if self.grid.get(row_idx, col_idx).alive_next_gen():
+                        next_gen.grid.get(row_idx, col_idx).is_alive = True
                     else:
-                        next_gen.grid[row_idx][col_idx].is_alive = False
+                        next_gen.grid.get(row_idx, col_idx).is_alive = False
         self.grid = deepcopy(next_gen.grid)
     
 
@@ -1,9 +1,20 @@
 import copy
+import os
+import sys
+import numpy as np
 import pytest
-from datastructures.array import Array
+from datastructures.array import Array, CopyPolicy
 
 from tests.car import Car, Color, Make, Model
 
+
+def double(value):
+    return value * 2
+
+def add(left, right):
+    return left + right
+
+
 class TestArray:
     car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
     car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
@@ -157,3 +168,501 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_append_should_double_the_physical_size_only_when_the_array_is_full(self):
+        array = Array[int](starting_sequence=[], data_type=int)
+        capacities = []
+        for i in range(10):
+            array.append(i)
+            capacities.append(array.get_capacity())
+        assert capacities == [1, 2, 4, 4, 8, 8, 8, 8, 16, 16]
+        assert list(array) == [i for i in range(10)]
+
+    def test_index_operator_should_use_the_logical_size_when_the_array_has_spare_capacity(self):
+        array = Array[int](starting_sequence=[1, 2, 3], data_type=int)
+        array.append(4)
+        assert array[-1] == 4
+        with pytest.raises(IndexError):
+            array[4]
+
+    def test_numeric_arrays_should_be_typed_and_string_arrays_should_store_objects(self):
+        assert Array[int](starting_sequence=[1, 2], data_type=int).is_typed
+        strings = Array[str](starting_sequence=['zero', 'one'], data_type=str)
+        assert not strings.is_typed
+        assert strings[0] == 'zero'
+
+    def test_get_range_should_return_a_read_only_view_of_the_logical_items(self, setup_numerical_array: Array):
+        view = setup_numerical_array.get_range(2, 5)
+        assert view.tolist() == [2, 3, 4]
+        with pytest.raises(ValueError):
+            view[0] = 100
+
+    def test_set_range_should_overwrite_items_in_bulk_and_check_the_dtype_once(self, setup_numerical_array: Array):
+        setup_numerical_array.set_range(7, [70, 80, 90])
+        assert list(setup_numerical_array.get_range(6)) == [6, 70, 80, 90]
+        with pytest.raises(TypeError):
+            setup_numerical_array.set_range(0, [1.5])
+        with pytest.raises(IndexError):
+            setup_numerical_array.set_range(9, [1, 2])
+
+    def test_reductions_should_return_python_values_for_typed_and_object_arrays(self, setup_numerical_array: Array):
+        assert setup_numerical_array.sum() == 45
+        assert setup_numerical_array.min() == 0
+        assert setup_numerical_array.max() == 9
+        assert setup_numerical_array.argmax() == 9
+        words = Array[str](starting_sequence=['b', 'c', 'a'], data_type=str)
+        assert words.max() == 'c'
+        assert words.argmax() == 1
+        with pytest.raises(ValueError):
+            Array[int](starting_sequence=[], data_type=int).min()
+
+    def test_slicing_should_return_a_view_that_shares_the_buffer_of_the_array(self, setup_numerical_array: Array):
+        view = setup_numerical_array[2:8:2]
+        assert isinstance(view, Array.View)
+        assert list(view) == [2, 4, 6]
+        assert view.to_numpy().base is not None
+        setup_numerical_array[4] = 40
+        assert view[1] == 40
+
+    def test_writing_to_a_view_should_write_through_to_the_array(self, setup_numerical_array: Array):
+        view = setup_numerical_array[::-1]
+        view[0] = 90
+        assert setup_numerical_array[9] == 90
+        assert view[1:3] == Array([8, 7])
+        with pytest.raises(TypeError):
+            view[0] = 'string'
+
+    def test_copying_a_view_should_create_an_independent_array(self, setup_numerical_array: Array):
+        copied = setup_numerical_array[0:3].copy()
+        copied[0] = 100
+        assert isinstance(copied, Array)
+        assert setup_numerical_array[0] == 0
+        assert list(copied) == [100, 1, 2]
+
+    def test_numpy_should_see_only_the_logical_items_without_copying(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)    # leaves spare capacity behind the logical items
+        exported = np.asarray(setup_numerical_array)
+        assert exported.tolist() == [i for i in range(11)]
+        assert np.shares_memory(exported, setup_numerical_array.get_elements())
+
+    def test_object_arrays_should_export_through_the_array_protocol(self, setup_complex_object_array: Array):
+        exported = np.asarray(setup_complex_object_array)
+        assert exported.dtype == object
+        assert exported[0] is setup_complex_object_array[0]
+
+    def test_the_array_protocol_should_refuse_a_dtype_conversion_without_a_copy(self, setup_numerical_array: Array):
+        assert setup_numerical_array.__array__(np.float64).tolist() == [float(i) for i in range(10)]
+        assert np.shares_memory(setup_numerical_array.__array__(copy=False), setup_numerical_array.get_elements())
+        with pytest.raises(ValueError):
+            setup_numerical_array.__array__(np.float64, copy=False)
+        with pytest.raises(ValueError):
+            np.asarray(Array(['a', 'b'], data_type=str), dtype='U1', copy=False)
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Python classes export buffers from 3.12 on")
+    def test_typed_arrays_should_export_the_buffer_protocol(self, setup_numerical_array: Array):
+        assert memoryview(setup_numerical_array).tobytes() == np.arange(10, dtype=np.int64).tobytes()
+
+    def test_a_file_backed_array_should_grow_on_disk_and_reopen_with_the_same_items(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.from_file(path, data_type=int, mode='w+') as array:
+            for i in range(100):
+                array.append(i)
+            assert array.pop() == 99
+            assert isinstance(array.get_elements(), np.memmap)
+        assert path.stat().st_size == 32 + 99 * 8
+        assert Array.load(path) == Array(list(range(99)), data_type=int)
+
+        reopened = Array.from_file(path, data_type=int, mode='r')
+        assert len(reopened) == 99
+        assert reopened[98] == 98
+        assert list(reopened.get_range(0, 3)) == [0, 1, 2]
+        with pytest.raises(ValueError):
+            reopened.append(1)
+
+    def test_a_file_backed_array_that_was_never_closed_should_reopen_without_the_spare_capacity(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        array = Array.from_file(path, data_type=int, mode='w+')
+        for i in range(1, 4):
+            array.append(i)
+        assert path.stat().st_size > 32 + 3 * 8      # the spare capacity is on disk until close()
+        assert list(Array.from_file(path, data_type=int, mode='r')) == [1, 2, 3]
+        array.pop()
+        assert list(Array.from_file(path, data_type=int, mode='r')) == [1, 2]
+        array.close()
+
+    def test_a_read_only_file_backed_array_should_refuse_changes_without_losing_items(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.from_file(path, data_type=int, mode='w+') as array:
+            array.extend([1, 2, 3])
+        reopened = Array.from_file(path, data_type=int, mode='r')
+        for change in (reopened.pop, reopened.pop_front, lambda: reopened.insert(0, 0), lambda: reopened.__setitem__(0, 5)):
+            with pytest.raises(ValueError):
+                change()
+        assert list(reopened) == [1, 2, 3]
+        with pytest.raises(ValueError):
+            Array.from_file(path, data_type=float, mode='r')
+
+    def test_a_file_backed_array_should_only_hold_native_data_types(self, tmp_path):
+        with pytest.raises(ValueError):
+            Array.from_file(tmp_path / 'cars.bin', data_type=Car, mode='w+')
+
+    def test_front_operations_should_use_room_at_the_front_instead_of_shifting(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        capacity = setup_numerical_array.get_capacity()
+        setup_numerical_array.append_front(100)     # reuses the slot the pop left behind
+        assert setup_numerical_array.get_capacity() == capacity
+        for i in range(20):
+            setup_numerical_array.append_front(-i)
+        assert setup_numerical_array[0] == -19
+        assert setup_numerical_array[20] == 100
+        assert list(setup_numerical_array.get_range(21)) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    def test_mixed_front_and_back_operations_should_keep_the_items_in_order(self):
+        array = Array[str](starting_sequence=[], data_type=str)
+        expected = []
+        for i in range(50):
+            array.append_front(str(i))
+            expected.insert(0, str(i))
+            array.append(str(-i))
+            expected.append(str(-i))
+            if i % 3 == 0:
+                assert array.pop_front() == expected.pop(0)
+                assert array.pop() == expected.pop()
+        assert list(array) == expected
+
+    def test_front_operations_on_a_file_backed_array_should_keep_the_file_in_order(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.from_file(path, data_type=int, mode='w+') as array:
+            array.append(2)
+            array.append_front(1)
+            array.append_front(0)
+            assert array.pop_front() == 0
+        assert list(Array.from_file(path, data_type=int, mode='r').get_range()) == [1, 2]
+
+    def test_the_reference_copy_policy_should_store_the_callers_objects(self):
+        array = Array[Car](starting_sequence=[self.car1], data_type=Car, copy_policy=CopyPolicy.REFERENCE)
+        array.append(self.car2)
+        assert array[0] is self.car1
+        assert array[1] is self.car2
+
+    def test_the_shallow_and_deep_copy_policies_should_store_copies(self):
+        shallow = Array[list](starting_sequence=[[self.car1]], data_type=list, copy_policy=CopyPolicy.SHALLOW)
+        deep = Array[list](starting_sequence=[[self.car1]], data_type=list)
+        assert deep.get_copy_policy() is CopyPolicy.DEEP
+        assert shallow[0] is not deep[0]
+        assert shallow[0][0] is self.car1
+        assert deep[0][0] is not self.car1
+        assert deep[0][0] == self.car1
+
+    def test_from_numpy_should_pick_the_data_type_from_the_dtype_and_copy_the_values(self):
+        source = np.arange(5)
+        array = Array.from_numpy(source)
+        source[0] = 100
+        assert array.get_data_type() is int
+        assert list(array.get_range()) == [0, 1, 2, 3, 4]
+        with pytest.raises(TypeError):
+            Array.from_numpy(np.array([0.5, 1.5]), data_type=int)
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.zeros((2, 2)))
+
+    def test_bulk_checks_should_accept_exactly_the_items_append_accepts(self):
+        floats = Array([1.5], data_type=float)
+        for bulk in (lambda values: Array(list(values), data_type=float), floats.extend, lambda values: floats.set_range(0, values)):
+            for values in ([1], [2], np.array([1])):
+                with pytest.raises(TypeError):
+                    bulk(values)
+        with pytest.raises(TypeError):
+            floats.extend([1.0, 2])     # numpy would turn the list into floats, but 2 is still an int
+        assert list(floats) == [1.5]
+        with pytest.raises(TypeError):
+            floats.append(1)
+        numbers = Array([1], data_type=int)
+        numbers.extend([True])      # bool is an int, for append() too
+        numbers.append(False)
+        assert list(numbers) == [1, 1, 0]
+        with pytest.raises(TypeError):
+            Array([1], data_type=bool)
+
+    def test_from_numpy_should_take_unsigned_values_that_fit_in_an_int(self):
+        array = Array.from_numpy(np.array([1, 2], dtype=np.uint64))
+        assert array.get_data_type() is int
+        assert list(array) == [1, 2]
+        with pytest.raises(TypeError):
+            Array.from_numpy(np.array([2 ** 63], dtype=np.uint64))
+
+    def test_from_iterable_should_consume_a_generator(self):
+        array = Array.from_iterable((str(i) for i in range(5)), data_type=str)
+        assert list(array) == ['0', '1', '2', '3', '4']
+
+    def test_extend_should_append_every_item_and_reject_the_whole_block_on_a_type_error(self, setup_numerical_array: Array):
+        setup_numerical_array.extend(range(10, 13))
+        setup_numerical_array.extend(np.array([13, 14]))
+        assert list(setup_numerical_array.get_range(9)) == [9, 10, 11, 12, 13, 14]
+        with pytest.raises(TypeError):
+            setup_numerical_array.extend([15, 'sixteen'])
+        assert len(setup_numerical_array) == 15
+
+    def test_extend_should_keep_nested_sequences_as_single_items(self):
+        array = Array[list](starting_sequence=[], data_type=list)
+        array.extend([[1, 2], [3]])
+        assert array[0] == [1, 2]
+        assert array[1] == [3]
+
+    def test_contains_should_ignore_stale_slots_past_the_logical_size(self, setup_numerical_array: Array):
+        setup_numerical_array.pop()
+        assert 9 not in setup_numerical_array
+        assert 'string' not in setup_numerical_array
+
+    def test_index_count_and_find_all_should_search_the_logical_range(self):
+        array = Array[int](starting_sequence=[5, 1, 5, 2, 5], data_type=int)
+        assert array.index(5) == 0
+        assert array.index(5, 1) == 2
+        assert array.index(5, -2) == 4
+        with pytest.raises(ValueError):
+            array.index(5, 1, 2)
+        assert array.count(5) == 3
+        assert array.find_all(5).tolist() == [0, 2, 4]
+
+    def test_searching_an_object_array_should_compare_items_one_by_one(self, setup_complex_object_array: Array):
+        assert setup_complex_object_array.index(self.car2) == 1
+        assert setup_complex_object_array.count(self.car3) == 1
+        lists = Array[list](starting_sequence=[[1], [2], [1]], data_type=list)
+        assert lists.find_all([1]).tolist() == [0, 2]
+
+    def test_contains_many_should_check_every_value_in_one_call(self, setup_numerical_array: Array, setup_complex_object_array: Array):
+        assert setup_numerical_array.contains_many([0, 10, 'nine', 9]).tolist() == [True, False, False, True]
+        assert setup_complex_object_array.contains_many([self.car1, Car('000')]).tolist() == [True, False]
+
+    def test_sort_should_order_a_typed_array_in_place(self):
+        array = Array[int](starting_sequence=[3, 1, 2], data_type=int)
+        array.append_front(5)
+        array.sort()
+        assert list(array) == [1, 2, 3, 5]
+        array.sort(reverse=True)
+        assert list(array) == [5, 3, 2, 1]
+
+    def test_sort_should_be_stable_and_move_complex_objects_without_copying(self, setup_complex_object_array: Array):
+        first, second, third = setup_complex_object_array[0], setup_complex_object_array[1], setup_complex_object_array[2]
+        setup_complex_object_array.sort(key=lambda car: car.make.name)
+        assert setup_complex_object_array[0] is third
+        assert setup_complex_object_array[1] is first
+        assert setup_complex_object_array[2] is second
+        setup_complex_object_array.sort(reverse=True)
+        assert list(setup_complex_object_array) == [self.car3, self.car2, self.car1]
+
+    def test_growth_factor_and_shrink_threshold_should_be_configurable(self):
+        array = Array[int](starting_sequence=[], data_type=int, growth_factor=1.5, shrink_threshold=0.5)
+        capacities = []
+        for i in range(6):
+            array.append(i)
+            capacities.append(array.get_capacity())
+        assert capacities == [1, 2, 3, 5, 5, 8]
+        for i in range(2):
+            array.pop()
+        assert array.get_capacity() == 5
+        with pytest.raises(ValueError):
+            Array[int](starting_sequence=[], data_type=int, growth_factor=2, shrink_threshold=0.5)
+        with pytest.raises(ValueError):
+            Array[int](starting_sequence=[], data_type=int, growth_factor=1)
+
+    def test_the_default_shrink_threshold_should_follow_the_growth_factor(self):
+        array = Array[int](starting_sequence=list(range(16)), data_type=int, growth_factor=4)
+        array.shrink_to_fit()
+        for i in range(15):
+            array.pop()
+        assert array.get_capacity() == 4      # shrinks at 1/16 load, to a quarter of the capacity
+
+    def test_alternating_append_and_pop_at_a_boundary_should_not_reallocate(self):
+        array = Array[int](starting_sequence=[1, 2, 3, 4], data_type=int)
+        array.append(5)
+        buffer = array.get_elements()
+        for i in range(10):
+            array.pop()
+            array.append(i)
+        assert array.get_elements() is buffer
+
+    def test_reserve_should_stop_shrinking_below_the_reserved_size_until_shrink_to_fit(self):
+        array = Array[int](starting_sequence=[1], data_type=int)
+        array.reserve(100)
+        buffer = array.get_elements()
+        for i in range(99):
+            array.append(i)
+        while len(array) > 0:
+            array.pop()
+        assert array.get_elements() is buffer
+        assert array.get_capacity() == 100
+        array.append(1)
+        array.shrink_to_fit()
+        assert array.get_capacity() == 1
+        assert list(array) == [1]
+
+    def test_insert_should_place_the_item_before_the_index(self, setup_numerical_array: Array):
+        setup_numerical_array.insert(0, -1)
+        setup_numerical_array.insert(5, 100)
+        setup_numerical_array.insert(len(setup_numerical_array), 10)
+        setup_numerical_array.insert(-1, 9)
+        assert list(setup_numerical_array) == [-1, 0, 1, 2, 3, 100, 4, 5, 6, 7, 8, 9, 9, 10]
+        with pytest.raises(IndexError):
+            setup_numerical_array.insert(100, 1)
+        with pytest.raises(TypeError):
+            setup_numerical_array.insert(0, 'string')
+
+    def test_insert_many_should_open_one_gap_for_all_of_the_values(self, setup_numerical_array: Array):
+        setup_numerical_array.insert_many(2, [20, 21, 22])
+        assert list(setup_numerical_array.get_range(0, 7)) == [0, 1, 20, 21, 22, 2, 3]
+        assert len(setup_numerical_array) == 13
+
+    def test_delete_many_should_remove_every_index_and_keep_the_order(self, setup_numerical_array: Array):
+        setup_numerical_array.delete_many([0, -1, 4, 4])
+        assert list(setup_numerical_array) == [1, 2, 3, 5, 6, 7, 8]
+        with pytest.raises(IndexError):
+            setup_numerical_array.delete_many([20])
+        for indices in (np.array([True, False, False]), [1.7], [True]):
+            with pytest.raises(TypeError):
+                setup_numerical_array.delete_many(indices)
+        setup_numerical_array.delete_many(np.array([0], dtype=np.uint8))
+        setup_numerical_array.delete_many([])
+        assert list(setup_numerical_array) == [2, 3, 5, 6, 7, 8]
+
+    def test_delete_where_should_accept_a_predicate_or_a_mask(self, setup_numerical_array: Array, setup_complex_object_array: Array):
+        assert setup_numerical_array.delete_where(setup_numerical_array.get_range() % 2 == 0) == 5
+        assert list(setup_numerical_array) == [1, 3, 5, 7, 9]
+        assert setup_complex_object_array.delete_where(lambda car: car.make == Make.TOYOTA) == 2
+        assert list(setup_complex_object_array) == [self.car3]
+
+    def test_a_snapshot_should_share_the_buffer_until_the_array_is_changed(self, setup_numerical_array: Array):
+        snapshot = setup_numerical_array.snapshot()
+        assert snapshot.is_snapshot
+        assert np.shares_memory(snapshot.get_range(), setup_numerical_array.get_range())
+        setup_numerical_array[0] = 100
+        assert not np.shares_memory(snapshot.get_range(), setup_numerical_array.get_range())
+        assert list(snapshot) == [i for i in range(10)]
+        buffer = setup_numerical_array.get_elements()
+        setup_numerical_array[1] = 200      # only the first write after a snapshot copies
+        assert setup_numerical_array.get_elements() is buffer
+
+    def test_every_kind_of_change_should_leave_the_snapshot_alone(self, setup_numerical_array: Array):
+        snapshot = setup_numerical_array.snapshot()
+        setup_numerical_array.pop()
+        setup_numerical_array.append(-1)
+        setup_numerical_array.sort()
+        setup_numerical_array.delete_many([0])
+        assert list(snapshot) == [i for i in range(10)]
+
+    def test_a_snapshot_should_refuse_to_change(self, setup_numerical_array: Array):
+        snapshot = setup_numerical_array.snapshot()
+        with pytest.raises(TypeError):
+            snapshot[0] = 1
+        with pytest.raises(TypeError):
+            snapshot.append(1)
+        with pytest.raises(TypeError):
+            snapshot[0:2][0] = 1
+        for change in (snapshot.close, lambda: snapshot.reserve(100), snapshot.shrink_to_fit):
+            with pytest.raises(TypeError):
+                change()
+        assert list(snapshot) == list(range(10))
+        assert snapshot.get_capacity() == setup_numerical_array.get_capacity()
+
+    def test_appending_after_an_interrupted_append_should_overwrite_the_uncommitted_bytes(self, tmp_path):
+        numbers_path, words_path = tmp_path / 'numbers.arr', tmp_path / 'words.arr'
+        Array([1, 2, 3], data_type=int).save(numbers_path)
+        Array(['a', 'b'], data_type=str).save(words_path)
+        with open(numbers_path, 'ab') as file:      # an append that wrote its items but died before updating the count
+            file.write(np.array([99, 98], dtype=np.int64).tobytes())
+        with open(words_path, 'ab') as file:
+            file.write(b'\x05\x00\x00')
+        assert list(Array.load(numbers_path)) == [1, 2, 3]
+        Array([1, 2, 3, 4], data_type=int).save(numbers_path, append=True)
+        Array(['a', 'b', 'c'], data_type=str).save(words_path, append=True)
+        assert list(Array.load(numbers_path)) == [1, 2, 3, 4]
+        assert list(Array.load(numbers_path, mmap=False)) == [1, 2, 3, 4]
+        assert list(Array.load(words_path)) == ['a', 'b', 'c']
+
+    def test_parallel_map_should_keep_the_order_of_a_typed_array(self):
+        array = Array(list(range(1000)), data_type=int)
+        doubled = array.parallel_map(double, workers=2, chunk_size=64)
+        assert doubled == Array([value * 2 for value in range(1000)], data_type=int)
+
+    def test_parallel_map_should_send_object_chunks_and_allow_a_new_data_type(self):
+        array = Array(['a', 'b', 'c', 'd', 'e'], data_type=str)
+        assert list(array.parallel_map(double, workers=2, chunk_size=2)) == ['aa', 'bb', 'cc', 'dd', 'ee']
+        assert array.parallel_map(len, workers=2, data_type=int) == Array([1] * 5, data_type=int)
+
+    def test_parallel_reduce_should_fold_the_chunks_starting_from_initial(self):
+        array = Array([float(value) for value in range(1, 101)], data_type=float)
+        assert array.parallel_reduce(add, 0.5, workers=2, chunk_size=16) == 5050.5
+        assert Array([], data_type=int).parallel_reduce(add, 7) == 7
+        assert len(Array([], data_type=int).parallel_map(double)) == 0
+
+    def test_save_should_write_only_the_logical_items_of_a_typed_array(self, tmp_path):
+        path = tmp_path / 'numbers.arr'
+        array = Array(list(range(100)), data_type=int)
+        array.reserve(10_000)
+        array.save(path)
+        assert os.path.getsize(path) == 32 + 100 * 8
+        for mmap in (True, False):
+            loaded = Array.load(path, mmap=mmap)
+            assert loaded == array
+            assert loaded.get_data_type() is int
+
+    def test_a_memory_mapped_load_should_copy_on_write(self, tmp_path):
+        path = tmp_path / 'floats.arr'
+        Array([1.5, 2.5], data_type=float).save(path)
+        loaded = Array.load(path)
+        loaded[0] = 9.5
+        loaded.append(3.5)
+        assert list(loaded) == [9.5, 2.5, 3.5]
+        assert list(Array.load(path)) == [1.5, 2.5]
+
+    def test_save_should_store_an_object_array_as_pickle_records(self, tmp_path):
+        path = tmp_path / 'cars.arr'
+        cars = [Car('123', Color.RED, Make.TOYOTA, Model.CAMRY), Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)]
+        array = Array(cars, data_type=Car)
+        array.save(path)
+        loaded = Array.load(path)
+        assert loaded.get_data_type() is Car
+        assert list(loaded) == cars
+
+    def test_appending_a_save_should_write_only_the_new_items(self, tmp_path):
+        path = tmp_path / 'checkpoint.arr'
+        array = Array(['a', 'b'], data_type=str)
+        array.save(path, append=True)       # no file yet, so a full save
+        array.extend(['c', 'd'])
+        size = os.path.getsize(path)
+        array.save(path, append=True)
+        assert os.path.getsize(path) > size
+        assert list(Array.load(path)) == ['a', 'b', 'c', 'd']
+        with pytest.raises(ValueError):
+            Array(['a'], data_type=str).save(path, append=True)
+        with pytest.raises(ValueError):
+            Array([1, 2, 3, 4, 5], data_type=int).save(path, append=True)
+
+    def test_load_should_reject_other_files(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'not an array')
+        with pytest.raises(ValueError):
+            Array.load(path)
+
+    def test_iteration_should_yield_native_values_within_the_logical_length(self):
+        array = Array([1, 2, 3], data_type=int)
+        array.reserve(100)
+        array.append_front(0)
+        assert list(array) == [0, 1, 2, 3]
+        assert all(type(value) is int for value in array)
+        assert list(reversed(array)) == [3, 2, 1, 0]
+        assert type(next(reversed(array))) is int
+
+    def test_iteration_should_cross_chunk_boundaries(self):
+        values = [float(value) for value in range(10_000)]
+        array = Array(values, data_type=float)
+        assert list(array) == values
+        assert list(reversed(array)) == values[::-1]
+
+    def test_iter_chunks_should_yield_read_only_numpy_slices(self):
+        array = Array(list(range(10)), data_type=int)
+        chunks = list(array.iter_chunks(4))
+        assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert all(isinstance(chunk, np.ndarray) and not chunk.flags.writeable for chunk in chunks)
+        assert sum(int(chunk.sum()) for chunk in array.iter_chunks(3)) == 45
+        with pytest.raises(ValueError):
+            next(Array([], data_type=int).iter_chunks(0))
@@ -1,5 +1,8 @@
+from copy import deepcopy
+import numpy as np
 import pytest
 from datastructures.array2d import Array2D
+from projects.project2.grid import Grid
 
 
 class TestArray2D:
@@ -119,4 +122,214 @@ class TestArray2D:
         assert filled3x3 == filled3x3
         assert filled3x3 != diff_filled
 
-    
\ No newline at end of file
+    
+    # ✅ Test tuple indexing reads and writes single items
+    def test_tuple_indexing(self, filled3x3: Array2D[int]) -> None:
+        """Ensures arr[r, c] reads and writes items without going through a Row."""
+        assert filled3x3[1, 2] == 6
+        assert type(filled3x3[1, 2]) is int
+        filled3x3[2, 0] = 70
+        assert filled3x3[2][0] == 70
+        assert filled3x3[-1, -1] == 9
+        with pytest.raises(IndexError):
+            _ = filled3x3[3, 0]
+        with pytest.raises(TypeError):
+            filled3x3[0, 0] = "one"
+
+    # ✅ Test row and column views
+    def test_row_and_col_are_zero_copy_views(self, filled3x3: Array2D[int]) -> None:
+        """Ensures row() and col() return read-only numpy views that see later writes."""
+        row, col = filled3x3.row(1), filled3x3.col(1)
+        assert row.tolist() == [4, 5, 6]
+        assert col.tolist() == [2, 5, 8]
+        filled3x3[1][1] = 50
+        assert row[1] == 50 and col[1] == 50
+        with pytest.raises(ValueError):
+            row[0] = 0
+
+    # ✅ Test non-square arrays keep rows and columns apart
+    def test_non_square_array(self) -> None:
+        """Checks that a 2x3 Array2D keeps 2 rows of 3 columns."""
+        array = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        assert len(array) == 2
+        assert [list(row) for row in array] == [[1, 2, 3], [4, 5, 6]]
+        assert array[1][2] == 6
+        assert repr(array).startswith("Array2D 2 Rows x 3 Columns")
+        empty = Array2D.empty(rows=2, cols=4, data_type=str)
+        assert [list(row) for row in empty] == [[''] * 4] * 2
+        assert len(Array2D.empty(rows=0, cols=0, data_type=int)) == 0
+
+    # ✅ Test object arrays keep their items as they are
+    def test_object_items(self) -> None:
+        """Ensures object items (even sequences) are stored as given and each empty cell gets its own default."""
+        array = Array2D([[[1], [2]], [[3], [4]]], data_type=list)
+        assert array[1, 0] == [3]
+        empty = Array2D.empty(rows=2, cols=2, data_type=list)
+        empty[0, 0].append(1)
+        assert empty[0, 1] == []
+
+    # ✅ Test rectangular sub-blocks
+    def test_sub_block_is_a_view(self, filled3x3: Array2D[int]) -> None:
+        """Ensures arr[r0:r1, c0:c1] returns an Array2D that shares the original's buffer."""
+        block = filled3x3[0:2, 1:3]
+        assert isinstance(block, Array2D)
+        assert [list(row) for row in block] == [[2, 3], [5, 6]]
+        block[1, 1] = 60
+        assert filled3x3[1, 2] == 60
+        assert np.shares_memory(block.row(0), filled3x3.row(0))
+        assert [list(row) for row in filled3x3[1:]] == [[4, 5, 60], [7, 8, 9]]
+        assert [list(row) for row in filled3x3[2, :2]] == [[7, 8]]
+        with pytest.raises(IndexError):
+            _ = filled3x3[5, 0:2]
+
+    # ✅ Test tiling
+    def test_tiles_cover_the_array(self) -> None:
+        """Checks that tiles() yields every block once, with smaller blocks on the edges."""
+        array = Array2D([[row * 5 + col for col in range(5)] for row in range(4)], data_type=int)
+        tiles = list(array.tiles(2, 2))
+        assert [(row, col) for row, col, _ in tiles] == [(0, 0), (0, 2), (0, 4), (2, 0), (2, 2), (2, 4)]
+        assert [list(row) for row in tiles[2][2]] == [[4], [9]]
+        assert sum(sum(sum(row) for row in block) for _, _, block in tiles) == sum(range(20))
+        with pytest.raises(ValueError):
+            next(array.tiles(0, 2))
+
+    # ✅ Test the allocation-free access paths
+    def test_get_and_cached_rows(self, filled3x3: Array2D[int]) -> None:
+        """Ensures get(r, c) reads items directly and the same Row proxy is handed out for a row every time."""
+        assert filled3x3.get(2, 1) == 8
+        assert type(filled3x3.get(2, 1)) is int
+        assert filled3x3[0] is filled3x3[0]
+        assert filled3x3[-1] is filled3x3[2]
+        with pytest.raises(IndexError):
+            filled3x3.get(0, 3)
+
+    # ✅ Test copies do not share cached rows
+    def test_deepcopy_gets_its_own_rows(self, filled3x3: Array2D[int]) -> None:
+        """Ensures a deep copy's rows read and write the copy, not the original."""
+        _ = filled3x3[0]
+        copied = deepcopy(filled3x3)
+        copied[0][0] = 100
+        assert filled3x3[0][0] == 1
+        assert copied[0, 0] == 100
+
+    # ✅ Test vectorized equality
+    def test_eq_checks_shape_type_and_items(self, filled3x3: Array2D[int]) -> None:
+        """Ensures equality compares shapes, data types and items rather than text."""
+        assert filled3x3 == Array2D([[1, 2, 3], [4, 5, 6], [7, 8, 9]], data_type=int)
+        assert filled3x3 != Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        assert filled3x3 != Array2D([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]], data_type=float)
+        assert filled3x3 != "[[1, 2, 3], [4, 5, 6], [7, 8, 9]]"
+        assert filled3x3[0:2, 0:2] == Array2D([[1, 2], [4, 5]], data_type=int)
+
+    # ✅ Test content hashing
+    def test_content_hash_is_cached_until_a_write(self, filled3x3: Array2D[int]) -> None:
+        """Checks that equal arrays hash alike and that writes through rows and sub-blocks invalidate the cached hash."""
+        other = Array2D([[1, 2, 3], [4, 5, 6], [7, 8, 9]], data_type=int)
+        assert filled3x3.content_hash() == other.content_hash()
+        assert len({filled3x3, other}) == 1
+        before = filled3x3.content_hash()
+        filled3x3[1][1] = 0
+        assert filled3x3.content_hash() != before
+        assert filled3x3 != other
+        filled3x3[0:2, 0:2][1, 1] = 5
+        assert filled3x3.content_hash() == before
+        assert filled3x3 == other
+
+    # ✅ Test hashing object arrays
+    def test_object_content_hash(self) -> None:
+        """Ensures object arrays hash their items and refuse unhashable ones."""
+        assert Array2D([['a', 'b']], data_type=str).content_hash() == Array2D([['a', 'b']], data_type=str).content_hash()
+        with pytest.raises(TypeError):
+            Array2D([[[1]]], data_type=list).content_hash()
+
+    # ✅ Test bulk construction from numpy
+    def test_from_numpy(self) -> None:
+        """Ensures from_numpy copies a 2-D numpy array in one go and checks its dtype."""
+        values = np.arange(6).reshape(2, 3)
+        array = Array2D.from_numpy(values)
+        assert array.get_data_type() is int
+        assert [list(row) for row in array] == [[0, 1, 2], [3, 4, 5]]
+        values[0, 0] = 100
+        assert array[0, 0] == 0
+        assert Array2D.from_numpy(values.astype(np.uint64)).get_data_type() is int
+        with pytest.raises(TypeError):
+            Array2D.from_numpy(values, data_type=float)     # the constructor does not take ints as floats either
+        with pytest.raises(TypeError):
+            Array2D.from_numpy(np.ones((2, 2)), data_type=int)
+        with pytest.raises(ValueError):
+            Array2D.from_numpy(np.arange(3))
+
+    # ✅ Test streaming construction from rows
+    def test_from_rows(self) -> None:
+        """Ensures from_rows consumes any iterable of rows and checks types and lengths a row at a time."""
+        array = Array2D.from_rows(([row * 3 + col for col in range(3)] for row in range(4)), data_type=int)
+        assert len(array) == 4
+        assert array[3, 2] == 11
+        words = Array2D.from_rows(iter([['a', 'b'], ['c', 'd']]), data_type=str)
+        assert str(words) == "[[a, b], [c, d]]"
+        assert len(Array2D.from_rows([], data_type=int)) == 0
+        with pytest.raises(ValueError):
+            Array2D.from_rows([[1, 2], [3]], data_type=int)
+        with pytest.raises(TypeError):
+            Array2D.from_rows([[1, 2], [3.5, 4]], data_type=int)
+        with pytest.raises(TypeError):
+            Array2D.from_rows([['a', 1]], data_type=str)
+
+    # ✅ Test filled construction
+    def test_full(self) -> None:
+        """Ensures full fills every cell with one value and infers the data type from it."""
+        array = Array2D.full(2, 3, 1.5)
+        assert array.get_data_type() is float
+        assert [list(row) for row in array] == [[1.5] * 3] * 2
+        assert Array2D.full(1, 2, 'x') == Array2D([['x', 'x']], data_type=str)
+        with pytest.raises(TypeError):
+            Array2D.full(2, 2, 'x', data_type=int)
+
+    # ✅ Test transposing
+    def test_transpose_is_a_view(self) -> None:
+        """Ensures transpose() swaps rows and columns without copying and writes go through to the original."""
+        array = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        transposed = array.transpose()
+        assert [list(row) for row in transposed] == [[1, 4], [2, 5], [3, 6]]
+        assert transposed.get_order() == 'F'
+        transposed[2, 1] = 60
+        assert array[1, 2] == 60
+        assert transposed.transpose() == array
+
+    # ✅ Test reshaping
+    def test_reshape_shares_the_buffer(self) -> None:
+        """Ensures reshape() views the same items in a new shape and refuses reshapes that would copy."""
+        array = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        reshaped = array.reshape(3, 2)
+        assert [list(row) for row in reshaped] == [[1, 2], [3, 4], [5, 6]]
+        reshaped[0, 1] = 20
+        assert array[0, 1] == 20
+        assert [list(row) for row in array.transpose().reshape(2, 3, order='F')] == [[1, 3, 5], [20, 4, 6]]
+        with pytest.raises(ValueError):
+            array.reshape(4, 2)
+        with pytest.raises(ValueError):
+            array.transpose().reshape(2, 3)
+        with pytest.raises(ValueError):
+            array[0:2, 0:2].reshape(1, 4)
+
+    # ✅ Test column-major construction
+    def test_column_major_order(self) -> None:
+        """Ensures arrays can be built column-major, which makes columns contiguous, without changing how they read."""
+        array = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int, order='F')
+        assert array.get_order() == 'F'
+        assert array.col(1).flags.c_contiguous
+        assert array == Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        assert Array2D.from_numpy(np.arange(6).reshape(2, 3), order='F').get_order() == 'F'
+        assert Array2D.from_rows([[1, 2], [3, 4]], data_type=int, order='F').get_order() == 'F'
+        assert Array2D.full(2, 3, 0, order='F').get_order() == 'F'
+        assert Array2D.empty(2, 3, data_type=str, order='F').get_order() == 'F'
+        with pytest.raises(ValueError):
+            Array2D([[1]], data_type=int, order='K')
+
+    # ✅ Test copying a subclass that never runs Array2D.__init__
+    def test_deepcopy_of_grid_should_compare_equal(self) -> None:
+        """Ensures a Grid (which keeps its cells in its own Array2D) can be deep copied and the copy equals the original."""
+        grid = Grid(5, 4)
+        copied = deepcopy(grid)
+        assert copied == grid
+        assert copied.grid is not grid.grid
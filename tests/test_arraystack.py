@@ -9,7 +9,7 @@ from copy import deepcopy
 
 from datastructures.iarray import IArray, T
 
-from datastructures.array import Array, T
+from datastructures.array import Array, CopyPolicy, T
 from datastructures.istack import IStack
 
 from datastructures.arraystack import ArrayStack
@@ -101,3 +101,12 @@ class TestArrayStack:
     def test_repr(self, stack: ArrayStack) -> None:
         stack.push(1)
         stack.push(2)
+
+    def test_copy_policy(self) -> None:
+        shared = [1, 2]
+        by_reference = ArrayStack(max_size=2, data_type=list, copy_policy=CopyPolicy.REFERENCE)
+        by_copy = ArrayStack(max_size=2, data_type=list)
+        by_reference.push(shared)
+        by_copy.push(shared)
+        assert by_reference.peek is shared
+        assert by_copy.peek is not shared
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from datastructures.array import Array
+from datastructures.arraystream import ArrayStream
+
+
+@pytest.fixture
+def numbers() -> Array:
+    return Array(list(range(20)), data_type=int)
+
+
+class TestArrayStream:
+
+    def test_stages_are_lazy_until_collected(self, numbers: Array):
+        calls = []
+        def record(value):
+            calls.append(value)
+            return value
+        stream = numbers.stream().map(record).take(3)
+        assert isinstance(stream, ArrayStream)
+        assert calls == []
+        assert stream.collect() == [0, 1, 2]
+        assert calls == [0, 1, 2]
+
+    def test_map_filter_take_skip_match_python(self, numbers: Array):
+        result = numbers.stream().skip(2).filter(lambda value: value % 3 == 0).map(lambda value: value * 10).take(4).collect()
+        assert result == [value * 10 for value in range(2, 20) if value % 3 == 0][:4]
+
+    def test_vectorized_stages_run_in_numpy_for_typed_arrays(self, numbers: Array):
+        stream = numbers.stream().map(np.square).filter(lambda values: values % 2 == 0, vectorized=True).skip(1)
+        assert stream.collect() == [value * value for value in range(20) if value % 2 == 0][1:]
+        assert all(type(value) is int for value in stream)
+        assert stream.to_array() == Array([value * value for value in range(2, 20, 2)], data_type=int)
+
+    def test_chunk_groups_items_into_lists(self, numbers: Array):
+        assert numbers.stream().take(7).chunk(3).collect() == [[0, 1, 2], [3, 4, 5], [6]]
+        with pytest.raises(ValueError):
+            numbers.stream().chunk(0)
+
+    def test_to_array_data_type(self, numbers: Array):
+        assert numbers.stream().filter(lambda value: value > 15).to_array() == Array([16, 17, 18, 19], data_type=int)
+        assert numbers.stream().map(str).take(2).to_array().get_data_type() is str
+        assert numbers.stream().map(float).to_array(data_type=float).get_data_type() is float
+
+    def test_object_arrays_stream_without_touching_the_source(self):
+        words = Array(['apple', 'kiwi', 'banana'], data_type=str)
+        assert words.stream().map(str.upper).filter(lambda word: len(word) > 4).collect() == ['APPLE', 'BANANA']
+        assert list(words) == ['apple', 'kiwi', 'banana']
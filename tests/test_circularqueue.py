@@ -1,4 +1,5 @@
 import pytest
+from datastructures.array import CopyPolicy
 from datastructures.circularqueue import CircularQueue
 
 @pytest.fixture
@@ -103,4 +104,14 @@ class TestCircularQueue:
             q2.enqueue(i)
         q1.dequeue()
         q1.enqueue(5)
-        assert q1 != q2
\ No newline at end of file
+        assert q1 != q2
+
+    def test_copy_policy(self):
+        shared = [1, 2]
+        by_reference = CircularQueue(maxsize=2, data_type=list)
+        by_copy = CircularQueue(maxsize=2, data_type=list, copy_policy=CopyPolicy.DEEP)
+        by_reference.enqueue(shared)
+        by_copy.enqueue(shared)
+        assert by_copy.front is not shared
+        assert by_copy.dequeue() == shared
+        assert by_reference.dequeue() is shared
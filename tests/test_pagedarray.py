@@ -0,0 +1,107 @@
+import random
+import numpy as np
+import pytest
+
+from datastructures.array import Array, CopyPolicy
+from datastructures.pagedarray import PagedArray
+
+
+@pytest.fixture
+def paged() -> PagedArray:
+    return PagedArray(list(range(10)), data_type=int, chunk_size=4)
+
+
+class TestPagedArray:
+
+    def test_items_are_spread_over_fixed_size_chunks(self, paged: PagedArray):
+        assert len(paged) == 10
+        assert paged.get_chunk_count() == 3
+        assert list(paged) == list(range(10))
+        assert paged[5] == 5 and type(paged[5]) is int
+        assert paged[-1] == 9
+
+    def test_chunk_size_must_be_a_power_of_two(self):
+        with pytest.raises(ValueError):
+            PagedArray([], data_type=int, chunk_size=6)
+
+    def test_growing_only_adds_chunks_and_never_moves_old_ones(self, paged: PagedArray):
+        first = next(paged.iter_chunks())
+        for i in range(10, 100):
+            paged.append(i)
+        paged.append_front(-1)
+        assert list(paged) == list(range(-1, 100))
+        assert np.shares_memory(first, paged.get_range(1, 5))
+
+    def test_pop_and_pop_front_release_empty_chunks(self, paged: PagedArray):
+        for _ in range(5):
+            paged.pop_front()
+        assert paged.get_chunk_count() == 2
+        for _ in range(4):
+            paged.pop()
+        assert list(paged) == [5]
+        assert paged.get_chunk_count() == 1
+        paged.pop()
+        assert paged.get_chunk_count() == 0
+        with pytest.raises(IndexError):
+            paged.pop()
+
+    def test_type_checks(self, paged: PagedArray):
+        with pytest.raises(TypeError):
+            paged.append('eleven')
+        with pytest.raises(TypeError):
+            paged[0] = 1.5
+        with pytest.raises(TypeError):
+            PagedArray([1, 2.5], data_type=int)
+
+    def test_slices_become_arrays(self, paged: PagedArray):
+        assert paged[2:9] == Array(list(range(2, 9)), data_type=int)
+        assert list(paged[::-3]) == list(range(10))[::-3]
+        assert len(paged[5:2]) == 0
+
+    def test_delitem_and_contains(self, paged: PagedArray):
+        del paged[2]
+        del paged[-1]
+        assert list(paged) == [0, 1, 3, 4, 5, 6, 7, 8]
+        assert 3 in paged
+        assert 2 not in paged
+        assert 'three' not in paged
+
+    def test_eq_compares_against_paged_and_regular_arrays(self, paged: PagedArray):
+        assert paged == PagedArray(list(range(10)), data_type=int, chunk_size=8)
+        assert paged == Array(list(range(10)), data_type=int)
+        assert paged != PagedArray(list(range(9)), data_type=int, chunk_size=4)
+
+    def test_copy_policy_applies_to_object_items(self):
+        shared = [1, 2]
+        by_reference = PagedArray([shared], data_type=list, copy_policy=CopyPolicy.REFERENCE)
+        by_copy = PagedArray([shared], data_type=list)
+        by_copy.append(shared)
+        assert by_reference[0] is shared
+        assert by_copy[0] is not shared and by_copy[1] is not shared
+        assert by_copy.pop() == shared
+
+    def test_random_operations_match_a_list(self):
+        rng = random.Random(14)
+        paged = PagedArray([], data_type=int, chunk_size=4)
+        expected: list[int] = []
+        for _ in range(2000):
+            op = rng.randrange(5)
+            if op == 0:
+                value = rng.randrange(100)
+                paged.append(value)
+                expected.append(value)
+            elif op == 1:
+                value = rng.randrange(100)
+                paged.append_front(value)
+                expected.insert(0, value)
+            elif expected and op == 2:
+                assert paged.pop() == expected.pop()
+            elif expected and op == 3:
+                assert paged.pop_front() == expected.pop(0)
+            elif expected:
+                index = rng.randrange(len(expected))
+                del paged[index]
+                del expected[index]
+            assert len(paged) == len(expected)
+        assert list(paged) == expected
+        assert list(reversed(paged)) == expected[::-1]
@@ -0,0 +1,50 @@
+import pytest
+from datastructures.sortedarray import SortedArray
+
+from tests.car import Car, Color, Make, Model
+
+
+class TestSortedArray:
+    car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
+    car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
+    car3 = Car('789', Color.BLACK, Make.FORD, Model.FUSION)
+
+    @pytest.fixture
+    def setup_numerical_sorted_array(self) -> SortedArray[int]:
+        return SortedArray[int](starting_sequence=[7, 3, 9, 3, 1], data_type=int)
+
+    def test_constructor_should_sort_the_starting_sequence(self, setup_numerical_sorted_array: SortedArray):
+        assert list(setup_numerical_sorted_array) == [1, 3, 3, 7, 9]
+
+    def test_append_should_put_the_item_in_sorted_position(self, setup_numerical_sorted_array: SortedArray):
+        setup_numerical_sorted_array.append(5)
+        setup_numerical_sorted_array.append_front(10)
+        assert list(setup_numerical_sorted_array) == [1, 3, 3, 5, 7, 9, 10]
+
+    def test_bisect_left_and_bisect_right_should_surround_equal_items(self, setup_numerical_sorted_array: SortedArray):
+        assert setup_numerical_sorted_array.bisect_left(3) == 1
+        assert setup_numerical_sorted_array.bisect_right(3) == 3
+        assert setup_numerical_sorted_array.bisect_left(100) == 5
+
+    def test_contains_operator_should_use_binary_search(self, setup_numerical_sorted_array: SortedArray):
+        assert 7 in setup_numerical_sorted_array
+        assert 4 not in setup_numerical_sorted_array
+        assert 'string' not in setup_numerical_sorted_array
+
+    def test_a_sorted_array_of_complex_objects_should_order_by_their_comparison_operators(self):
+        cars = SortedArray[Car](starting_sequence=[self.car3, self.car1], data_type=Car)
+        cars.append(self.car2)
+        assert list(cars) == [self.car1, self.car2, self.car3]
+        assert self.car2 in cars
+
+    def test_deleting_an_item_should_keep_the_rest_sorted(self, setup_numerical_sorted_array: SortedArray):
+        del setup_numerical_sorted_array[1]
+        assert list(setup_numerical_sorted_array) == [1, 3, 7, 9]
+
+    def test_setting_an_item_by_index_should_raise_a_type_error(self, setup_numerical_sorted_array: SortedArray):
+        with pytest.raises(TypeError):
+            setup_numerical_sorted_array[0] = 0
+
+    def test_inserting_at_an_index_should_raise_a_type_error(self, setup_numerical_sorted_array: SortedArray):
+        with pytest.raises(TypeError):
+            setup_numerical_sorted_array.insert(0, 0)
@@ -0,0 +1,103 @@
+import pytest
+
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+
+class TestSparseArray2D:
+
+    @pytest.fixture
+    def board(self) -> SparseArray2D[int]:
+        """Returns a mostly empty 4x5 board."""
+        return SparseArray2D([[0, 0, 0, 0, 0], [0, 7, 0, 0, 0], [0, 0, 0, 0, 3], [0, 0, 0, 0, 0]], data_type=int)
+
+    def test_only_non_default_cells_are_stored(self, board: SparseArray2D[int]) -> None:
+        assert board.get_entry_count() == 2
+        assert len(board) == 4 and board.get_num_cols() == 5
+        assert board[1][1] == 7 and board[1, 1] == 7
+        assert board.get(0, 0) == 0
+        assert board[-2, -1] == 3
+
+    def test_writes_keep_defaults_out(self, board: SparseArray2D[int]) -> None:
+        board[0, 0] = 5
+        board[1][1] = 0
+        assert board.get_entry_count() == 2
+        assert list(board.items()) == [((0, 0), 5), ((2, 4), 3)]
+        with pytest.raises(TypeError):
+            board[0, 0] = 'five'
+        with pytest.raises(IndexError):
+            board[4, 0] = 1
+        with pytest.raises(IndexError):
+            _ = board[0][5]
+
+    def test_iteration_skips_defaults_only_in_items(self, board: SparseArray2D[int]) -> None:
+        assert [list(row) for row in board] == [[0, 0, 0, 0, 0], [0, 7, 0, 0, 0], [0, 0, 0, 0, 3], [0, 0, 0, 0, 0]]
+        assert list(board[2].items()) == [(4, 3)]
+        assert list(board[0].items()) == []
+        assert [list(row) for row in reversed(board)][1] == [0, 0, 0, 0, 3]
+
+    def test_compact_switches_to_csr_and_back(self, board: SparseArray2D[int]) -> None:
+        before = list(board.items())
+        board.compact()
+        assert board.is_compacted
+        assert list(board.items()) == before
+        assert board[1, 1] == 7 and type(board[1, 1]) is int
+        assert board[1, 2] == 0
+        assert list(board[2].items()) == [(4, 3)]
+        board[3, 3] = 9
+        assert not board.is_compacted
+        assert list(board.items()) == before + [((3, 3), 9)]
+
+    def test_memory_scales_with_entries(self) -> None:
+        small = SparseArray2D.empty(rows=10, cols=10, data_type=int)
+        huge = SparseArray2D.empty(rows=100_000, cols=100_000, data_type=int)
+        for index in range(10):
+            small[index, index] = 1
+            huge[index * 1000, index * 1000] = 1
+        assert huge.memory_usage() == small.memory_usage()
+        assert huge.get(99_999, 99_999) == 0
+
+    def test_dense_conversion_round_trip(self, board: SparseArray2D[int]) -> None:
+        dense = board.to_array2d()
+        assert dense == Array2D([[0, 0, 0, 0, 0], [0, 7, 0, 0, 0], [0, 0, 0, 0, 3], [0, 0, 0, 0, 0]], data_type=int)
+        assert SparseArray2D.from_array2d(dense) == board
+        words = SparseArray2D.from_array2d(Array2D([['', 'a'], ['', '']], data_type=str))
+        assert list(words.items()) == [((0, 1), 'a')]
+
+    def test_eq_compares_shape_default_and_entries(self, board: SparseArray2D[int]) -> None:
+        other = SparseArray2D.empty(rows=4, cols=5, data_type=int)
+        other[1, 1] = 7
+        other[2, 4] = 3
+        other.compact()
+        assert board == other
+        other[2, 4] = 4
+        assert board != other
+        assert board != SparseArray2D.empty(rows=4, cols=5, data_type=int, default=1)
+        assert str(SparseArray2D.empty(rows=1, cols=2, data_type=object)) == "[[None, None]]"
+
+    def test_a_mutable_default_is_refused(self) -> None:
+        for data_type in (list, dict):
+            with pytest.raises(ValueError):
+                SparseArray2D.empty(rows=2, cols=2, data_type=data_type)
+        with pytest.raises(ValueError):
+            SparseArray2D([[[1]]], data_type=list, default=[])
+        cells = SparseArray2D.empty(rows=2, cols=2, data_type=object)
+        cells[0, 0] = [1]
+        assert cells[1, 1] is None and cells.get_entry_count() == 1
+
+    def test_row_access_only_visits_the_entries_of_that_row(self) -> None:
+        board = SparseArray2D.empty(rows=3000, cols=3000, data_type=int)
+        for index in range(3000):
+            board[index, (index * 7) % 3000] = index + 1
+        assert sum(len(list(row.items())) for row in board) == 3000
+        assert list(board[5].items()) == [(35, 6)]
+        board[5, 35] = 0
+        assert list(board[5].items()) == [] and board.get_entry_count() == 2999
+
+    def test_init_errors(self) -> None:
+        with pytest.raises(ValueError):
+            SparseArray2D([1, 2], data_type=int)
+        with pytest.raises(ValueError):
+            SparseArray2D([[1, 2], [3]], data_type=int)
+        with pytest.raises(ValueError):
+            SparseArray2D([[1, 'two']], data_type=int)